@@ -0,0 +1,100 @@
+"""
+Benchmark: badge engine throughput on a replayed event stream
+
+Replays a synthetic mix of completions, swaps, ratings and point changes
+through the event bus at several user counts. Per-event cost should stay
+flat as the user base grows, since each event only touches the counters
+and rules of the users involved.
+
+    python benchmarks/bench_badges.py --users 10000 100000 --events 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from careswap import badges, events  # noqa: E402
+
+
+BADGE_CATALOG = {rule.badge_id: {'name': rule.badge_id.replace('_', ' ').title(), 'icon': '*'}
+                 for rule in badges.DEFAULT_RULES}
+CATEGORIES = ['technology', 'errands', 'skill_swap', 'general']
+
+
+def make_users(count):
+    return {
+        f'user{i}@example.com': {
+            'type': 'senior' if i % 2 else 'youth',
+            'aura_points': 100,
+            'level': 1,
+            'badges': [],
+            'completed_tasks': 0
+        }
+        for i in range(count)
+    }
+
+
+def make_stream(user_count, event_count, seed=42):
+    """Pre-generate (event, payload) pairs so generation is not timed."""
+    rng = random.Random(seed)
+    seniors = user_count // 2
+    stream = []
+    for i in range(event_count):
+        poster = f'user{rng.randrange(seniors) * 2 + 1}@example.com'
+        helper = f'user{rng.randrange(user_count - seniors) * 2}@example.com'
+        roll = rng.random()
+        if roll < 0.5:
+            req = {'posted_by': poster, 'accepted_by': helper, 'category': rng.choice(CATEGORIES)}
+            stream.append((badges.REQUEST_COMPLETED, {'req': req}))
+        elif roll < 0.6:
+            req = {'posted_by': poster, 'accepted_by': helper, 'category': 'skill_swap'}
+            stream.append((badges.SWAP_COMPLETED, {'req': req}))
+        elif roll < 0.85:
+            stream.append((badges.RATING_RECEIVED, {'email': helper, 'stars': rng.choice([3, 4, 5, 5])}))
+        else:
+            stream.append((badges.POINTS_CHANGED, {'email': helper}))
+    return stream
+
+
+def run(user_count, event_count):
+    users = make_users(user_count)
+    engine = badges.BadgeEngine(users, {}, BADGE_CATALOG)
+    bus = events.EventBus()
+    engine.register(bus)
+    stream = make_stream(user_count, event_count)
+
+    started = time.perf_counter()
+    for event, payload in stream:
+        if event == badges.POINTS_CHANGED:
+            users[payload['email']]['aura_points'] += 70
+        bus.publish(event, **payload)
+    elapsed = time.perf_counter() - started
+
+    for event, handler in ((badges.REQUEST_COMPLETED, engine.on_request_completed),
+                           (badges.SWAP_COMPLETED, engine.on_swap_completed),
+                           (badges.RATING_RECEIVED, engine.on_rating_received),
+                           (badges.POINTS_CHANGED, engine.on_points_changed)):
+        bus.unsubscribe(event, handler)
+
+    awarded = sum(len(user['badges']) for user in users.values())
+    print(f'{user_count:>10,} users  {event_count:>10,} events  '
+          f'{elapsed:6.2f}s  {event_count / elapsed:>10,.0f} events/s  '
+          f'{elapsed / event_count * 1e6:6.2f} us/event  {awarded:,} badges awarded')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--events', type=int, default=500_000)
+    args = parser.parse_args()
+
+    for user_count in args.users:
+        run(user_count, args.events)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark: snapshot write and mmap restore time
+
+Builds synthetic databases shaped like the app's, writes a snapshot and
+times restoring it, then measures how long a background save stalls
+other threads (a ticker thread records its longest gap while
+SnapshotWriter.save() runs, with and without forking). Defaults to the target scale of 1M users and 5M
+requests, which needs roughly 8 GB of RAM; pass smaller counts to run
+on a laptop.
+
+    python benchmarks/bench_snapshot.py --users 1000000 --requests 5000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from careswap import snapshot  # noqa: E402
+
+
+CATEGORIES = ['technology', 'errands', 'skill_swap', 'general']
+DIFFICULTIES = [('Easy', 50), ('Medium', 70), ('Hard', 120)]
+STATUSES = ['Open', 'In Progress', 'Completed']
+
+
+def make_users(count):
+    users = {}
+    for i in range(count):
+        email = f'user{i}@example.com'
+        user_type = 'senior' if i % 2 else 'youth'
+        users[email] = {
+            'id': i + 1,
+            'email': email,
+            'password': f'pw{i:08d}',
+            'name': f'User {i}',
+            'type': user_type,
+            'phone': f'+65 {80000000 + i}',
+            'bio': '',
+            'aura_points': 100 + i % 2000,
+            'level': 1 + i % 10,
+            'badges': [{'id': 'newcomer', 'name': 'Newcomer', 'icon': '🌱', 'earned': '2024-01-01'}],
+            'rating': (i % 50) / 10,
+            'rating_count': i % 40,
+            'completed_tasks': i % 60,
+            'joined_date': '2024-01-01',
+            'last_active': '2024-06-01T12:00:00',
+            'status': 'active',
+            'timeout_until': None,
+            'ban_reason': None,
+            'accessibility': {'font_size': 'large', 'high_contrast': False,
+                              'voice_enabled': True, 'reduced_motion': False},
+            'privacy': {'profile_visibility': 'registered', 'show_email': False,
+                        'show_phone': False, 'allow_contact': True, 'show_activity': True},
+            'notifications': {'email_new_match': True, 'email_messages': True,
+                              'email_weekly': False, 'app_all': True},
+            'skills_teach': ['Cooking'],
+            'skills_learn': ['Smartphone']
+        }
+    return users
+
+
+def make_requests(count, user_count):
+    requests = []
+    for i in range(count):
+        difficulty, points = DIFFICULTIES[i % 3]
+        status = STATUSES[i % 3]
+        requests.append({
+            'id': i + 1,
+            'title': f'Request {i}',
+            'description': 'Need a hand with something around the house.',
+            'category': CATEGORIES[i % 4],
+            'aura_points': points,
+            'difficulty': difficulty,
+            'status': status,
+            'user_type': 'Senior',
+            'location': 'Online',
+            'posted_by': f'user{(i * 2 + 1) % user_count}@example.com',
+            'posted_date': f'2024-{1 + i % 12:02d}-{1 + i % 28:02d}',
+            'accepted_by': None if status == 'Open' else f'user{(i * 2) % user_count}@example.com'
+        })
+    return requests
+
+
+def measure_stall(work, tick=0.001):
+    """Run `work` while a ticker thread records the longest gap between its ticks."""
+    done = threading.Event()
+    longest = [0.0]
+
+    def ticker():
+        last = time.perf_counter()
+        while not done.is_set():
+            time.sleep(tick)
+            now = time.perf_counter()
+            longest[0] = max(longest[0], now - last)
+            last = now
+
+    thread = threading.Thread(target=ticker)
+    thread.start()
+    try:
+        work()
+    finally:
+        done.set()
+        thread.join()
+    return longest[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=1_000_000)
+    parser.add_argument('--requests', type=int, default=5_000_000)
+    parser.add_argument('--path', default=None, help='Snapshot file (defaults to a temp file).')
+    args = parser.parse_args()
+
+    path = args.path or os.path.join(tempfile.mkdtemp(), 'bench.snapshot')
+
+    started = time.perf_counter()
+    sections = {
+        'users_db': make_users(args.users),
+        'requests_db': make_requests(args.requests, max(args.users, 1)),
+        'admins_db': {},
+        'admin_logs': []
+    }
+    print(f'Generated {args.users:,} users / {args.requests:,} requests in {time.perf_counter() - started:.2f}s')
+
+    started = time.perf_counter()
+    size = snapshot.write_snapshot(path, sections)
+    print(f'Write:   {time.perf_counter() - started:.2f}s ({size / 1024 / 1024:.1f} MiB)')
+
+    targets = {name: type(data)() for name, data in sections.items()}
+    del sections
+    gc.collect()
+
+    started = time.perf_counter()
+    snapshot.restore_snapshot(path, targets)
+    elapsed = time.perf_counter() - started
+    print(f'Restore: {elapsed:.2f}s ({len(targets["users_db"]):,} users, {len(targets["requests_db"]):,} requests)')
+
+    for use_fork in (False, True):
+        writer = snapshot.SnapshotWriter(path, targets)
+        writer.use_fork = use_fork and writer.use_fork
+        started = time.perf_counter()
+        stall = measure_stall(writer.save)
+        label = 'forked' if writer.use_fork else 'in-process'
+        print(f'Save ({label}): {time.perf_counter() - started:.2f}s, longest stall of other threads {stall * 1000:.0f} ms')
+
+    if not args.path:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Benchmark: import, app factory and first-request time, plus pre-fork sharing
+
+Each run starts a fresh interpreter and times `import careswap`,
+`create_app()` and the first two requests, so the numbers are what a
+newly spawned worker pays. With --users/--requests a synthetic snapshot
+is restored on the first request (or inside create_app with --preload).
+
+--fork N preloads the app once, forks N workers that each serve a few
+requests, and reports how much of each worker's memory is still shared
+with the parent, with and without gc.freeze() before forking.
+
+    python benchmarks/bench_startup.py --runs 5
+    python benchmarks/bench_startup.py --users 100000 --requests 500000 --preload --fork 4
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from careswap import snapshot  # noqa: E402
+from bench_snapshot import make_requests, make_users  # noqa: E402
+
+
+# Run in a child interpreter; prints one JSON line of timings
+STARTUP_CHILD = '''
+import json, resource, sys, time
+started = time.perf_counter()
+import careswap
+imported = time.perf_counter()
+app = careswap.create_app({'PRELOAD': %(preload)r})
+created = time.perf_counter()
+client = app.test_client()
+client.get('/')
+first = time.perf_counter()
+client.get('/login')
+second = time.perf_counter()
+print(json.dumps({
+    'import': imported - started,
+    'create_app': created - imported,
+    'first_request': first - created,
+    'second_request': second - first,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+}))
+'''
+
+# Preloads the app, forks workers and reports their shared/private memory
+FORK_CHILD = '''
+import gc, json, os, sys
+import careswap
+app = careswap.create_app({'PRELOAD': True})
+if %(freeze)r:
+    gc.freeze()
+
+def smaps(pid):
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    return fields
+
+results = []
+for _ in range(%(workers)d):
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        client = app.test_client()
+        for path in ('/', '/login', '/signup'):
+            client.get(path)
+        gc.collect()
+        mem = smaps(os.getpid())
+        os.write(write_fd, json.dumps(mem).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        results.append(json.loads(f.read()))
+    os.waitpid(pid, 0)
+
+rss = sum(r['Rss'] for r in results) / len(results)
+private = sum(r['Private_Clean'] + r['Private_Dirty'] for r in results) / len(results)
+print(json.dumps({'rss_mb': rss, 'private_mb': private, 'shared_mb': rss - private}))
+'''
+
+
+def run_child(code, env):
+    output = subprocess.run([sys.executable, '-c', code], env=env, cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def make_env(args, tmp):
+    env = dict(os.environ)
+    env.pop('CARESWAP_SNAPSHOT_PATH', None)
+    env.pop('CARESWAP_ARCHIVE_PATH', None)
+    if args.users:
+        path = os.path.join(tmp, 'bench.snapshot')
+        started = time.perf_counter()
+        size = snapshot.write_snapshot(path, {
+            'users_db': make_users(args.users),
+            'requests_db': make_requests(args.requests, args.users),
+            'admins_db': {},
+            'admin_logs': []
+        })
+        print(f'Snapshot: {args.users:,} users / {args.requests:,} requests, '
+              f'{size / 1024 / 1024:.1f} MiB, written in {time.perf_counter() - started:.2f}s')
+        env['CARESWAP_SNAPSHOT_PATH'] = path
+    return env
+
+
+def bench_startup(args, env):
+    runs = [run_child(STARTUP_CHILD % {'preload': args.preload}, env) for _ in range(args.runs)]
+    mode = 'preload' if args.preload else 'lazy'
+    print(f'\nStartup ({mode}, median of {args.runs} fresh interpreters):')
+    for phase in ('import', 'create_app', 'first_request', 'second_request'):
+        print(f'  {phase:<15} {statistics.median(r[phase] for r in runs) * 1000:9.1f} ms')
+    print(f'  {"max rss":<15} {statistics.median(r["max_rss_mb"] for r in runs):9.1f} MiB')
+
+
+def bench_fork(args, env):
+    print(f'\nPre-fork sharing ({args.fork} workers, per-worker average):')
+    for freeze in (False, True):
+        result = run_child(FORK_CHILD % {'freeze': freeze, 'workers': args.fork}, env)
+        label = 'gc.freeze()' if freeze else 'no freeze'
+        print(f'  {label:<12} rss {result["rss_mb"]:8.1f} MiB   shared {result["shared_mb"]:8.1f} MiB   '
+              f'private {result["private_mb"]:8.1f} MiB')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--users', type=int, default=0, help='Users in the synthetic snapshot (0 = seed data).')
+    parser.add_argument('--requests', type=int, default=0)
+    parser.add_argument('--preload', action='store_true', help='Load everything inside create_app().')
+    parser.add_argument('--fork', type=int, default=0, help='Also measure memory shared by N forked workers.')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = make_env(args, tmp)
+        bench_startup(args, env)
+        if args.fork:
+            bench_fork(args, env)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+CareSwap - Intergenerational Help & Skill Exchange Platform
+Flask Application with Admin System
+"""
+
+import os
+import secrets
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Route modules, registered in this order by create_app()
+BLUEPRINTS = ('public', 'user', 'dashboard', 'help_requests', 'admin', 'api')
+
+
+def create_app(config=None):
+    """Build a CareSwap app with its own databases.
+
+    Nothing is loaded here: the snapshot (or seed data) is read on the
+    first request or CLI command, and the archive, rating and badge
+    subsystems start the first time they are used. Set PRELOAD to do all
+    of that up front, e.g. in a pre-fork server master.
+    """
+    # Flask and the route modules are imported here rather than at module
+    # level, so `import careswap.snapshot` and friends stay cheap.
+    import importlib
+
+    from flask import Flask
+
+    from . import archive, cli, hooks, snapshot
+    from .state import CareSwapState
+
+    app = Flask(__name__,
+                template_folder=os.path.join(_ROOT, 'templates'),
+                static_folder=os.path.join(_ROOT, 'static'))
+
+    app.config.from_mapping(
+        SECRET_KEY=os.environ.get('CARESWAP_SECRET_KEY') or secrets.token_hex(32),
+        # Snapshots are opt-in: set CARESWAP_SNAPSHOT_PATH to persist state across restarts
+        SNAPSHOT_PATH=os.environ.get('CARESWAP_SNAPSHOT_PATH'),
+        SNAPSHOT_INTERVAL=int(os.environ.get('CARESWAP_SNAPSHOT_INTERVAL', snapshot.DEFAULT_INTERVAL)),
+        # Completed requests older than ARCHIVE_AFTER_DAYS move to the archive.
+        # It lives next to the snapshot so both persist (or not) together;
+        # with no snapshot it is kept in memory.
+        ARCHIVE_PATH=os.environ.get('CARESWAP_ARCHIVE_PATH') or None,
+        ARCHIVE_AFTER_DAYS=int(os.environ.get('CARESWAP_ARCHIVE_AFTER_DAYS', archive.DEFAULT_ARCHIVE_AFTER_DAYS)),
+        # Demo accounts and requests for a fresh app without a snapshot
+        LOAD_SEED_DATA=True,
+        PRELOAD=os.environ.get('CARESWAP_PRELOAD', '').lower() in ('1', 'true', 'yes')
+    )
+    if config:
+        app.config.update(config)
+    if app.config['ARCHIVE_PATH'] is None and app.config['SNAPSHOT_PATH']:
+        app.config['ARCHIVE_PATH'] = f"{app.config['SNAPSHOT_PATH']}.archive"
+
+    state = app.extensions['careswap'] = CareSwapState(app)
+
+    for name in BLUEPRINTS:
+        app.register_blueprint(importlib.import_module(f'.blueprints.{name}', __name__).bp)
+    hooks.register(app)
+    cli.register(app)
+
+    if app.config['PRELOAD']:
+        state.preload()
+
+    return app
@@ -0,0 +1,204 @@
+"""
+CareSwap - Analytics Rollups
+Incremental daily counters for the admin trends dashboard
+
+Each mutation route records into a per-day bucket, so charts and the JSON
+API read at most one bucket per day in the range and never rescan
+requests_db or admin_logs.
+"""
+
+import threading
+from datetime import date, datetime, timedelta
+
+
+REQUEST_EVENTS = ('posted', 'accepted', 'completed')
+MODERATION_ACTIONS = ('ban', 'unban', 'timeout', 'kick', 'warn')
+
+DEFAULT_DAYS = 30
+MAX_DAYS = 366 * 5
+
+_lock = threading.Lock()
+
+
+# ========================================
+# Buckets
+# ========================================
+
+def _day_key(when):
+    """Bucket key for a datetime, date or ISO string."""
+    if isinstance(when, str):
+        return when[:10]
+    return when.strftime('%Y-%m-%d')
+
+
+def _new_bucket():
+    return {
+        'requests': {event: 0 for event in REQUEST_EVENTS},
+        'by_category': {},
+        'by_difficulty': {},
+        'acceptance': {'count': 0, 'total_seconds': 0.0},
+        'signups': {},
+        'moderation': {}
+    }
+
+
+def _bucket(rollups, when):
+    day = _day_key(when)
+    bucket = rollups.get(day)
+    if bucket is None:
+        bucket = rollups[day] = _new_bucket()
+    return bucket
+
+
+def _bump(counters, key, amount=1):
+    counters[key] = counters.get(key, 0) + amount
+
+
+def _parse_time(value):
+    """Parse an ISO datetime or YYYY-MM-DD date, returning None if invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+# ========================================
+# Recording
+# ========================================
+
+def _record_request_event(rollups, req, event, when):
+    bucket = _bucket(rollups, when)
+    _bump(bucket['requests'], event)
+    for group, field in (('by_category', 'category'), ('by_difficulty', 'difficulty')):
+        counters = bucket[group].setdefault(req.get(field) or 'general', {e: 0 for e in REQUEST_EVENTS})
+        _bump(counters, event)
+
+
+def record_request_posted(rollups, req, when=None):
+    """Count a newly posted help request."""
+    with _lock:
+        _record_request_event(rollups, req, 'posted', when or req.get('posted_at') or req['posted_date'])
+
+
+def record_request_accepted(rollups, req, when=None):
+    """Count an accepted request and how long it waited to be accepted."""
+    when = when or datetime.now()
+    with _lock:
+        _record_request_event(rollups, req, 'accepted', when)
+        posted = _parse_time(req.get('posted_at') or req.get('posted_date'))
+        if posted is not None and when >= posted:
+            acceptance = _bucket(rollups, when)['acceptance']
+            acceptance['count'] += 1
+            acceptance['total_seconds'] += (when - posted).total_seconds()
+
+
+def record_request_completed(rollups, req, when=None):
+    """Count a completed request."""
+    with _lock:
+        _record_request_event(rollups, req, 'completed', when or datetime.now())
+
+
+def record_signup(rollups, user_type, when=None):
+    """Count a new user by type."""
+    with _lock:
+        _bump(_bucket(rollups, when or datetime.now())['signups'], user_type)
+
+
+def record_moderation(rollups, action, when=None):
+    """Count a moderation action; other admin actions are ignored."""
+    if action not in MODERATION_ACTIONS:
+        return
+    with _lock:
+        _bump(_bucket(rollups, when or datetime.now())['moderation'], action)
+
+
+def rebuild(rollups, users_db, requests_db, admin_logs):
+    """
+    Recompute all rollups from the raw databases.
+
+    Only needed once to backfill history that predates the rollups (e.g.
+    seed data on first boot); live traffic is recorded incrementally.
+    """
+    rollups.clear()
+    for user in users_db.values():
+        record_signup(rollups, user['type'], user['joined_date'])
+    for req in requests_db:
+        record_request_posted(rollups, req)
+        accepted_at = _parse_time(req.get('accepted_at'))
+        if accepted_at is not None:
+            record_request_accepted(rollups, req, accepted_at)
+        completed_at = req.get('completed_at')
+        if completed_at:
+            record_request_completed(rollups, req, completed_at)
+    for log in admin_logs:
+        record_moderation(rollups, log['action'], log['timestamp'])
+
+
+# ========================================
+# Queries
+# ========================================
+
+def day_range(days, end=None):
+    """Return the ISO day keys for the last `days` days ending at `end`."""
+    end = end or date.today()
+    days = max(1, min(days, MAX_DAYS))
+    start = end - timedelta(days=days - 1)
+    return [(start + timedelta(days=i)).isoformat() for i in range(days)]
+
+
+def series(rollups, days=DEFAULT_DAYS, end=None):
+    """
+    Build per-day series and range totals for the dashboard.
+
+    Cost is proportional to the number of days requested, independent of
+    how many requests or log entries exist.
+    """
+    keys = day_range(days, end)
+    empty = _new_bucket()
+
+    result = {
+        'days': keys,
+        'requests': {event: [] for event in REQUEST_EVENTS},
+        'avg_acceptance_hours': [],
+        'signups': {},
+        'moderation': {},
+        'by_category': {},
+        'by_difficulty': {},
+        'totals': {event: 0 for event in REQUEST_EVENTS}
+    }
+    acceptance_count = 0
+    acceptance_seconds = 0.0
+
+    for i, day in enumerate(keys):
+        bucket = rollups.get(day, empty)
+
+        for event in REQUEST_EVENTS:
+            count = bucket['requests'][event]
+            result['requests'][event].append(count)
+            result['totals'][event] += count
+
+        acceptance = bucket['acceptance']
+        result['avg_acceptance_hours'].append(
+            round(acceptance['total_seconds'] / acceptance['count'] / 3600, 2) if acceptance['count'] else None
+        )
+        acceptance_count += acceptance['count']
+        acceptance_seconds += acceptance['total_seconds']
+
+        for group in ('signups', 'moderation'):
+            for key, count in bucket[group].items():
+                result[group].setdefault(key, [0] * len(keys))[i] = count
+
+        for group in ('by_category', 'by_difficulty'):
+            for key, counters in bucket[group].items():
+                totals = result[group].setdefault(key, {event: 0 for event in REQUEST_EVENTS})
+                for event in REQUEST_EVENTS:
+                    totals[event] += counters[event]
+
+    result['totals']['signups'] = {key: sum(values) for key, values in result['signups'].items()}
+    result['totals']['moderation'] = {key: sum(values) for key, values in result['moderation'].items()}
+    result['totals']['avg_acceptance_hours'] = (
+        round(acceptance_seconds / acceptance_count / 3600, 2) if acceptance_count else None
+    )
+    return result
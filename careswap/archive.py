@@ -0,0 +1,351 @@
+"""
+CareSwap - Request Archive
+Append-only, compressed cold storage for completed help requests
+
+Requests are written in blocks. Each block has a small uncompressed
+manifest (request ids and posters) followed by the zlib-compressed JSON
+records, so the in-memory index can be rebuilt on open without
+decompressing anything:
+
+    block    magic (4s) | manifest length (I) | payload length (I) | crc32 (I)
+    manifest per record: id (Q) | poster length (H) | poster
+    payload  zlib(JSON list of request dicts)
+
+With no path the blocks are kept in memory instead, for apps whose
+state does not outlive the process anyway.
+"""
+
+import io
+import json
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:     # Windows: single-process use only
+    fcntl = None
+
+
+BLOCK_MAGIC = b'CSAB'
+BLOCK_SIZE = 256
+CACHE_BLOCKS = 32
+DEFAULT_ARCHIVE_AFTER_DAYS = 30
+DEFAULT_PAGE_SIZE = 10
+
+_BLOCK_HEADER = struct.Struct('<4sIII')
+_MANIFEST_ENTRY = struct.Struct('<QH')
+
+
+class ArchiveError(Exception):
+    """Raised when an archive block is unreadable."""
+
+
+def completed_before(req, cutoff):
+    """True if a completed request finished before `cutoff`."""
+    if req['status'] != 'Completed':
+        return False
+    finished = req.get('completed_at') or req.get('accepted_at') or req.get('posted_at') or req['posted_date']
+    try:
+        return datetime.fromisoformat(finished) < cutoff
+    except ValueError:
+        return False
+
+
+class RequestArchive:
+    """Append-only archive of requests indexed by id and poster."""
+
+    def __init__(self, path=None, logger=None):
+        self.path = path
+        self.logger = logger
+        self.max_id = 0
+        self._by_id = {}        # request id -> (block offset, position in block)
+        self._by_poster = {}    # poster email -> [request ids, oldest first]
+        self._blocks = []       # block offsets in file order
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory = io.BytesIO() if path is None else None
+        self._indexed_size = 0  # bytes of the file covered by the index
+        self._load_index()
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, request_id):
+        return request_id in self._by_id
+
+    # ----------------------------------------
+    # Index
+    # ----------------------------------------
+
+    def _load_index(self):
+        """Rebuild the index from block manifests, setting aside a bad tail."""
+        if self.path is None or not os.path.exists(self.path):
+            return
+        with self._locked_file() as f:
+            self._catch_up(f)
+
+    @contextmanager
+    def _locked_file(self):
+        """Open the archive file, holding an exclusive lock across processes."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, 'a+b') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield f
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _catch_up(self, f):
+        """Index blocks added since the last scan, by this or another process."""
+        file_size = os.fstat(f.fileno()).st_size
+        good_size = self._indexed_size
+        problem = None
+        f.seek(good_size)
+        while True:
+            offset = f.tell()
+            header = f.read(_BLOCK_HEADER.size)
+            if not header:
+                break
+            if len(header) < _BLOCK_HEADER.size:
+                problem = 'torn block header'
+                break
+            magic, manifest_len, payload_len, _ = _BLOCK_HEADER.unpack(header)
+            if magic != BLOCK_MAGIC:
+                problem = 'bad block magic'
+                break
+
+            manifest = f.read(manifest_len)
+            if len(manifest) < manifest_len or offset + _BLOCK_HEADER.size + manifest_len + payload_len > file_size:
+                problem = 'torn block'
+                break
+            try:
+                entries = _parse_manifest(manifest)
+            except (struct.error, UnicodeDecodeError):
+                problem = 'unreadable manifest'
+                break
+            f.seek(payload_len, os.SEEK_CUR)
+
+            self._index_entries(offset, entries)
+            good_size = f.tell()
+
+        self._indexed_size = good_size
+        if good_size < file_size:
+            self._set_aside_tail(f, good_size, file_size, problem)
+
+    def _set_aside_tail(self, f, good_size, file_size, problem):
+        """
+        Move everything after the last good block to a side file.
+
+        A crash mid-append leaves a partial block, and a bad write can leave
+        garbage; either way the next append must start on a block boundary.
+        The tail is kept rather than deleted so it can be inspected.
+        """
+        aside = f'{self.path}.corrupt-{datetime.now().strftime("%Y%m%d%H%M%S")}'
+        f.seek(good_size)
+        with open(aside, 'ab') as out:
+            out.write(f.read())
+        f.truncate(good_size)
+        if self.logger:
+            self.logger.error('Archive %s: %s at byte %d; indexed %d requests, moved the last %d bytes to %s',
+                              self.path, problem, good_size, len(self._by_id), file_size - good_size, aside)
+
+    def _index_entries(self, offset, entries):
+        self._blocks.append(offset)
+        for position, (request_id, poster) in enumerate(entries):
+            self._by_id[request_id] = (offset, position)
+            self._by_poster.setdefault(poster, []).append(request_id)
+            self.max_id = max(self.max_id, request_id)
+
+    # ----------------------------------------
+    # Writing
+    # ----------------------------------------
+
+    @contextmanager
+    def _open_for_append(self):
+        if self._memory is not None:
+            yield self._memory
+            return
+        # Several processes (e.g. gunicorn workers) may share the file: the
+        # lock keeps their blocks whole, and catching up first means ids
+        # another process already archived are not written twice.
+        with self._locked_file() as f:
+            self._catch_up(f)
+            yield f
+
+    def append(self, requests):
+        """Archive requests in compressed blocks. Already archived ids are skipped."""
+        if all(r['id'] in self._by_id for r in requests):
+            return 0
+
+        with self._lock, self._open_for_append() as f:
+            requests = [r for r in requests if r['id'] not in self._by_id]
+            f.seek(0, os.SEEK_END)
+            for start in range(0, len(requests), BLOCK_SIZE):
+                block = requests[start:start + BLOCK_SIZE]
+
+                manifest = bytearray()
+                for req in block:
+                    poster = req['posted_by'].encode('utf-8')
+                    manifest += _MANIFEST_ENTRY.pack(req['id'], len(poster)) + poster
+                payload = zlib.compress(json.dumps(block, ensure_ascii=False).encode('utf-8'))
+
+                offset = f.tell()
+                f.write(_BLOCK_HEADER.pack(BLOCK_MAGIC, len(manifest), len(payload), zlib.crc32(payload)))
+                f.write(manifest)
+                f.write(payload)
+                if f is not self._memory:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                self._index_entries(offset, [(req['id'], req['posted_by']) for req in block])
+            self._indexed_size = f.tell()
+
+        return len(requests)
+
+    # ----------------------------------------
+    # Reading
+    # ----------------------------------------
+
+    def _read_payload(self, f, offset):
+        f.seek(offset)
+        magic, manifest_len, payload_len, crc = _BLOCK_HEADER.unpack(f.read(_BLOCK_HEADER.size))
+        f.seek(manifest_len, os.SEEK_CUR)
+        payload = f.read(payload_len)
+        if magic != BLOCK_MAGIC or zlib.crc32(payload) != crc:
+            raise ArchiveError(f'Corrupt archive block at byte {offset} in {self.path or "memory"}')
+        return payload
+
+    def _read_block(self, offset):
+        """Decompress one block, keeping the most recent few in memory."""
+        with self._lock:
+            block = self._cache.get(offset)
+            if block is not None:
+                self._cache.move_to_end(offset)
+                return block
+
+            if self._memory is not None:
+                payload = self._read_payload(self._memory, offset)
+            else:
+                with open(self.path, 'rb') as f:
+                    payload = self._read_payload(f, offset)
+
+            block = json.loads(zlib.decompress(payload))
+            self._cache[offset] = block
+            if len(self._cache) > CACHE_BLOCKS:
+                self._cache.popitem(last=False)
+            return block
+
+    def _read_block_or_skip(self, offset):
+        """Like _read_block, but log a corrupt block and return None."""
+        try:
+            return self._read_block(offset)
+        except (ArchiveError, zlib.error, ValueError) as e:
+            if self.logger:
+                self.logger.error('Skipping unreadable archive block: %s', e)
+            return None
+
+    def get(self, request_id):
+        """Return an archived request by id, or None."""
+        location = self._by_id.get(request_id)
+        if location is None:
+            return None
+        offset, position = location
+        block = self._read_block_or_skip(offset)
+        return block[position] if block is not None else None
+
+    def count_for_poster(self, email):
+        """Number of archived requests posted by `email`."""
+        return len(self._by_poster.get(email, ()))
+
+    def page_for_poster(self, email, page=1, per_page=DEFAULT_PAGE_SIZE):
+        """Return one page of a poster's archived requests, newest first."""
+        ids = self._by_poster.get(email, [])
+        end = len(ids) - (page - 1) * per_page
+        start = max(0, end - per_page)
+        if end <= 0:
+            return []
+        requests = (self.get(request_id) for request_id in reversed(ids[start:end]))
+        return [req for req in requests if req is not None]
+
+    def iter_records(self):
+        """Yield every archived request in archive order, one block at a time."""
+        for offset in list(self._blocks):
+            block = self._read_block_or_skip(offset)
+            if block is not None:
+                yield from block
+
+    def holds_copy(self, req):
+        """True if `req` is already archived exactly as it is."""
+        return req['id'] in self._by_id and self.get(req['id']) == req
+
+
+def _parse_manifest(manifest):
+    """Decode a block manifest into (request id, poster) pairs."""
+    entries = []
+    pos = 0
+    while pos < len(manifest):
+        request_id, poster_len = _MANIFEST_ENTRY.unpack_from(manifest, pos)
+        pos += _MANIFEST_ENTRY.size
+        if pos + poster_len > len(manifest):
+            raise struct.error('manifest entry runs past the end of the manifest')
+        entries.append((request_id, manifest[pos:pos + poster_len].decode('utf-8')))
+        pos += poster_len
+    return entries
+
+
+def iter_requests(requests_db, request_archive):
+    """Yield every request once: the archive, then hot requests not archived yet."""
+    # Archiving removes items from requests_db in place, so walk a copy
+    # of the (cheap, reference-only) list taken before the archive
+    hot = list(requests_db)
+    yield from request_archive.iter_records()
+    for req in hot:
+        if not request_archive.holds_copy(req):
+            yield req
+
+
+def archive_completed(requests_db, request_archive, older_than_days=DEFAULT_ARCHIVE_AFTER_DAYS, now=None,
+                      lock=None):
+    """
+    Move completed requests older than `older_than_days` out of the hot list.
+
+    Requests are written to the archive first and only then removed from
+    `requests_db` (in place), so a crash in between leaves duplicates that
+    the next run drops rather than losing history. Only exact completed
+    copies count as duplicates: a hot request that merely reuses an
+    archived id (say, seed data reloaded next to an older archive) is
+    left alone. Returns the number of requests moved.
+
+    Removing items shifts the ones after them, so a loop over `requests_db`
+    running meanwhile would skip entries; pass the lock those loops hold
+    and the removal waits for them.
+    """
+    cutoff = (now or datetime.now()) - timedelta(days=older_than_days)
+    cold = []
+    for req in requests_db:
+        if req['status'] != 'Completed':
+            continue
+        if req['id'] in request_archive:
+            if request_archive.holds_copy(req):
+                cold.append(req)
+        elif completed_before(req, cutoff):
+            cold.append(req)
+    if not cold:
+        return 0
+
+    request_archive.append(cold)
+    # Matched by identity, so a hot request sharing an archived id survives
+    cold_refs = {id(r) for r in cold}
+    # Only rewrite the prefix that was scanned; requests posted meanwhile
+    # are appended past it and survive the slice assignment.
+    with lock or nullcontext():
+        scanned = len(requests_db)
+        requests_db[:scanned] = [r for r in requests_db[:scanned] if id(r) not in cold_refs]
+    return len(cold)
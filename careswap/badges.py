@@ -0,0 +1,166 @@
+"""
+CareSwap - Badge & Level Engine
+Awards badges and levels incrementally from domain events
+
+Every event bumps a few per-user counters, and only the rules watching
+those counters are checked, so the cost per event is constant no matter
+how many users or rules exist.
+"""
+
+import threading
+from collections import namedtuple
+from datetime import datetime
+
+
+# AURA points needed per level (level 1 starts at 0 points)
+LEVEL_STEP = 250
+
+# Domain events the engine listens to
+REQUEST_COMPLETED = 'request_completed'
+SWAP_COMPLETED = 'swap_completed'
+RATING_RECEIVED = 'rating_received'
+POINTS_CHANGED = 'points_changed'
+
+Rule = namedtuple('Rule', ['badge_id', 'counter', 'threshold'])
+
+# Rules for badges in all_badges that can be derived from events.
+# Community Champion and Patient Teacher need monthly rankings and written
+# praise, which the platform does not record yet.
+DEFAULT_RULES = [
+    Rule('first_helper', 'tasks_helped', 1),
+    Rule('super_helper', 'tasks_helped', 50),
+    Rule('tech_guru', 'tech_taught', 10),
+    Rule('tech_learner', 'tech_learned', 5),
+    Rule('wisdom_sharer', 'swaps_taught', 1),
+    Rule('first_swap', 'swaps', 1),
+    Rule('helper_star', 'five_star_ratings', 10),
+    Rule('social_butterfly', 'connections', 10)
+]
+
+
+def level_for_points(points):
+    """Level for an AURA point total."""
+    return 1 + max(points, 0) // LEVEL_STEP
+
+
+class BadgeEngine:
+    """Keeps per-user counters and awards badges as events arrive."""
+
+    def __init__(self, users_db, state_db, badge_catalog, rules=DEFAULT_RULES, lock=None):
+        self.users_db = users_db
+        self.state_db = state_db          # email -> {'counters', 'connections', 'awarded'}
+        self.badge_catalog = badge_catalog
+        self.rules_by_counter = {}
+        for rule in rules:
+            self.rules_by_counter.setdefault(rule.counter, []).append(rule)
+        self._lock = lock if lock is not None else threading.Lock()
+
+    def register(self, events):
+        """Subscribe the engine's handlers to an event bus."""
+        events.subscribe(REQUEST_COMPLETED, self.on_request_completed)
+        events.subscribe(SWAP_COMPLETED, self.on_swap_completed)
+        events.subscribe(RATING_RECEIVED, self.on_rating_received)
+        events.subscribe(POINTS_CHANGED, self.on_points_changed)
+
+    # ----------------------------------------
+    # State
+    # ----------------------------------------
+
+    def _state(self, email):
+        state = self.state_db.get(email)
+        if state is None:
+            user = self.users_db[email]
+            state = self.state_db[email] = {
+                # Seed counters from fields that predate the engine
+                'counters': {'tasks_helped': user.get('completed_tasks', 0) if user['type'] == 'youth' else 0},
+                'connections': set(),
+                'awarded': {badge['id'] for badge in user['badges']}
+            }
+        return state
+
+    def _bump(self, email, counter, amount=1):
+        """Increment one counter and check only the rules that watch it."""
+        state = self._state(email)
+        counters = state['counters']
+        value = counters[counter] = counters.get(counter, 0) + amount
+
+        awarded = []
+        for rule in self.rules_by_counter.get(counter, ()):
+            if value >= rule.threshold and rule.badge_id not in state['awarded']:
+                self._award(email, state, rule.badge_id)
+                awarded.append(rule.badge_id)
+        return awarded
+
+    def _award(self, email, state, badge_id):
+        badge = self.badge_catalog[badge_id]
+        state['awarded'].add(badge_id)
+        self.users_db[email]['badges'].append({
+            'id': badge_id,
+            'name': badge['name'],
+            'icon': badge['icon'],
+            'earned': datetime.now().strftime('%Y-%m-%d')
+        })
+
+    def _connect(self, email, other):
+        """Record a distinct user `email` has worked with."""
+        connections = self._state(email)['connections']
+        if other in connections:
+            return []
+        connections.add(other)
+        return self._bump(email, 'connections')
+
+    # ----------------------------------------
+    # Event Handlers
+    # ----------------------------------------
+
+    def on_request_completed(self, req):
+        """Credit the helper and the poster of a completed request."""
+        helper = req.get('accepted_by')
+        poster = req['posted_by']
+        is_tech = req.get('category') == 'technology'
+        if not helper or helper == poster:
+            return    # nobody helped, or the poster helped themselves
+
+        with self._lock:
+            if helper in self.users_db:
+                self._bump(helper, 'tasks_helped')
+                self.users_db[helper]['completed_tasks'] += 1
+                if is_tech:
+                    self._bump(helper, 'tech_taught')
+                if poster in self.users_db:
+                    self._connect(helper, poster)
+
+            if poster in self.users_db:
+                if is_tech:
+                    self._bump(poster, 'tech_learned')
+                if helper in self.users_db:
+                    self._connect(poster, helper)
+
+    def on_swap_completed(self, req):
+        """Both sides of a skill swap taught and learned something."""
+        helper = req.get('accepted_by')
+        poster = req['posted_by']
+        if not helper or helper == poster:
+            return
+
+        with self._lock:
+            for email in (poster, helper):
+                if email in self.users_db:
+                    self._bump(email, 'swaps')
+            if poster in self.users_db:
+                self._bump(poster, 'swaps_taught')
+
+    def on_rating_received(self, email, stars):
+        """Count ratings, and five-star ratings separately."""
+        if email not in self.users_db:
+            return
+        with self._lock:
+            self._bump(email, 'ratings_received')
+            if stars == 5:
+                self._bump(email, 'five_star_ratings')
+
+    def on_points_changed(self, email):
+        """Recompute a user's level from their AURA points."""
+        user = self.users_db.get(email)
+        if user is not None:
+            user['level'] = level_for_points(user['aura_points'])
@@ -0,0 +1,4 @@
+"""
+CareSwap - Blueprints
+Route modules, imported by create_app() when the app is built
+"""
@@ -0,0 +1,224 @@
+"""
+CareSwap - Admin Routes
+Moderation, analytics and bulk data for administrators
+"""
+
+import io
+from datetime import datetime, timedelta
+
+from flask import (Blueprint, Response, abort, current_app, flash, redirect, render_template, request,
+                   session, stream_with_context, url_for)
+
+from .. import analytics, bulk
+from ..db import admin_logs, admins_db, analytics_db, rating_book, request_archive, requests_db, users_db
+from ..decorators import admin_required
+from ..helpers import export_dataset, get_current_admin, import_dataset, log_admin_action
+from ..state import get_state
+
+bp = Blueprint('admin', __name__)
+
+
+@bp.route('/admin/login', methods=['GET', 'POST'])
+def admin_login():
+    """Admin login page."""
+    if request.method == 'POST':
+        email = request.form.get('email', '').lower().strip()
+        password = request.form.get('password', '')
+        
+        if email in admins_db and admins_db[email]['password'] == password:
+            session['admin_email'] = email
+            admins_db[email]['last_login'] = datetime.now().isoformat()
+            flash('Welcome, Administrator!', 'success')
+            return redirect(url_for('admin.admin_dashboard'))
+        else:
+            flash('Invalid admin credentials.', 'danger')
+    
+    return render_template('admin_login.html')
+
+@bp.route('/admin/logout')
+def admin_logout():
+    """Admin logout."""
+    session.pop('admin_email', None)
+    flash('Admin logged out.', 'info')
+    return redirect(url_for('admin.admin_login'))
+
+@bp.route('/admin')
+@bp.route('/admin/dashboard')
+@admin_required
+def admin_dashboard():
+    """Admin dashboard."""
+    admin = get_current_admin()
+    
+    # Stats
+    stats = {
+        'total_users': len(users_db),
+        'seniors': sum(1 for u in users_db.values() if u['type'] == 'senior'),
+        'youths': sum(1 for u in users_db.values() if u['type'] == 'youth'),
+        'active_users': sum(1 for u in users_db.values() if u['status'] == 'active'),
+        'banned_users': sum(1 for u in users_db.values() if u['status'] == 'banned'),
+        'timeout_users': sum(1 for u in users_db.values() if u['status'] == 'timeout'),
+        'total_requests': len(requests_db) + len(request_archive),
+        'open_requests': sum(1 for r in requests_db if r['status'] == 'Open'),
+        'completed_requests': len(request_archive) + sum(1 for r in requests_db if r['status'] == 'Completed'),
+        'archived_requests': len(request_archive)
+    }
+    
+    # User list
+    user_list = list(users_db.values())
+    sort = request.args.get('sort', 'joined')
+    if sort == 'rating':
+        user_list.sort(key=lambda u: rating_book.adjusted_score(u['email']), reverse=True)
+    
+    # Recent admin actions
+    recent_logs = admin_logs[-10:][::-1]  # Last 10, reversed
+    
+    return render_template('admin_dashboard.html', 
+                         admin=admin, 
+                         stats=stats, 
+                         users=user_list,
+                         logs=recent_logs,
+                         sort=sort,
+                         rating_score=rating_book.adjusted_score,
+                         recent_rating=rating_book.recent_average)
+
+@bp.route('/admin/user/<int:user_id>/ban', methods=['POST'])
+@admin_required
+def admin_ban_user(user_id):
+    """Ban a user."""
+    reason = request.form.get('reason', 'Violation of community guidelines')
+    
+    for email, user in users_db.items():
+        if user['id'] == user_id:
+            user['status'] = 'banned'
+            user['ban_reason'] = reason
+            
+            log_admin_action(session['admin_email'], 'ban', email, reason)
+            flash(f'User {user["name"]} has been banned.', 'warning')
+            break
+    
+    return redirect(url_for('admin.admin_dashboard'))
+
+@bp.route('/admin/user/<int:user_id>/unban', methods=['POST'])
+@admin_required
+def admin_unban_user(user_id):
+    """Unban a user."""
+    for email, user in users_db.items():
+        if user['id'] == user_id:
+            user['status'] = 'active'
+            user['ban_reason'] = None
+            
+            log_admin_action(session['admin_email'], 'unban', email)
+            flash(f'User {user["name"]} has been unbanned.', 'success')
+            break
+    
+    return redirect(url_for('admin.admin_dashboard'))
+
+@bp.route('/admin/user/<int:user_id>/timeout', methods=['POST'])
+@admin_required
+def admin_timeout_user(user_id):
+    """Timeout a user for a specified duration."""
+    hours = int(request.form.get('hours', 24))
+    reason = request.form.get('reason', 'Temporary restriction')
+    
+    for email, user in users_db.items():
+        if user['id'] == user_id:
+            user['status'] = 'timeout'
+            user['timeout_until'] = (datetime.now() + timedelta(hours=hours)).isoformat()
+            user['ban_reason'] = reason
+            
+            log_admin_action(session['admin_email'], 'timeout', email, f'{hours} hours - {reason}')
+            flash(f'User {user["name"]} has been put in timeout for {hours} hours.', 'warning')
+            break
+    
+    return redirect(url_for('admin.admin_dashboard'))
+
+@bp.route('/admin/user/<int:user_id>/kick', methods=['POST'])
+@admin_required
+def admin_kick_user(user_id):
+    """Force logout a user (kick)."""
+    for email, user in users_db.items():
+        if user['id'] == user_id:
+            # In a real app, you'd invalidate their session token
+            # For now, we just log the action
+            log_admin_action(session['admin_email'], 'kick', email, 'Force logout')
+            flash(f'User {user["name"]} has been kicked (session invalidated).', 'info')
+            break
+    
+    return redirect(url_for('admin.admin_dashboard'))
+
+@bp.route('/admin/user/<int:user_id>/warn', methods=['POST'])
+@admin_required
+def admin_warn_user(user_id):
+    """Send a warning to a user."""
+    message = request.form.get('message', 'Please follow community guidelines.')
+    
+    for email, user in users_db.items():
+        if user['id'] == user_id:
+            log_admin_action(session['admin_email'], 'warn', email, message)
+            flash(f'Warning sent to {user["name"]}.', 'info')
+            break
+    
+    return redirect(url_for('admin.admin_dashboard'))
+
+@bp.route('/admin/requests/archive', methods=['POST'])
+@admin_required
+def admin_archive_requests():
+    """Archive old completed requests now."""
+    moved = get_state().archive_old_requests()
+    log_admin_action(session['admin_email'], 'archive', 'requests',
+                     f'{moved} requests older than {current_app.config["ARCHIVE_AFTER_DAYS"]} days')
+    flash(f'Archived {moved} completed requests.', 'success' if moved else 'info')
+    return redirect(url_for('admin.admin_dashboard'))
+
+@bp.route('/admin/analytics')
+@admin_required
+def admin_analytics():
+    """Trends dashboard served from the daily rollups."""
+    days = request.args.get('days', analytics.DEFAULT_DAYS, type=int)
+    trends = analytics.series(analytics_db, days)
+    return render_template('admin_analytics.html', admin=get_current_admin(), trends=trends, days=len(trends['days']))
+
+@bp.route('/admin/export/<dataset>')
+@admin_required
+def admin_export(dataset):
+    """Stream a dataset download as CSV or JSONL."""
+    fmt = request.args.get('format', 'csv')
+    if dataset not in bulk.EXPORT_FIELDS or fmt not in bulk.FORMATS:
+        abort(404)
+
+    log_admin_action(session['admin_email'], 'export', dataset, fmt.upper())
+    filename = f'careswap-{dataset}-{datetime.now().strftime("%Y%m%d-%H%M%S")}.{fmt}'
+    return Response(
+        stream_with_context(export_dataset(dataset, fmt)),
+        mimetype=bulk.MIMETYPES[fmt],
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+@bp.route('/admin/import/<dataset>', methods=['POST'])
+@admin_required
+def admin_import(dataset):
+    """Import an uploaded CSV or JSONL file into a dataset."""
+    upload = request.files.get('file')
+    if dataset not in bulk.EXPORT_FIELDS or not upload or not upload.filename:
+        flash('Please choose a CSV or JSONL file to import.', 'danger')
+        return redirect(url_for('admin.admin_dashboard'))
+
+    fmt = upload.filename.rsplit('.', 1)[-1].lower()
+    if fmt not in bulk.FORMATS:
+        flash('Only .csv and .jsonl files can be imported.', 'danger')
+        return redirect(url_for('admin.admin_dashboard'))
+
+    stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+    summary = import_dataset(dataset, stream, fmt)
+
+    details = f'{summary["imported"]} imported, {summary["skipped"]} skipped'
+    if summary['aborted']:
+        details += ' (stopped early)'
+    log_admin_action(session['admin_email'], 'import', dataset, details)
+    flash(f'Imported {summary["imported"]} {dataset}, skipped {summary["skipped"]}.',
+          'success' if not summary['skipped'] and not summary['aborted'] else 'warning')
+    if summary['aborted']:
+        flash(summary['aborted'], 'danger')
+    for error in summary['errors'][:5]:
+        flash(error, 'danger')
+    return redirect(url_for('admin.admin_dashboard'))
@@ -0,0 +1,47 @@
+"""
+CareSwap - API Routes
+JSON endpoints used by the frontend
+"""
+
+from datetime import datetime
+
+from flask import Blueprint, jsonify, request
+
+from .. import analytics
+from ..db import analytics_db
+from ..decorators import admin_required, login_required
+from ..helpers import get_current_user
+
+bp = Blueprint('api', __name__)
+
+
+@bp.route('/api/user/accessibility', methods=['POST'])
+@login_required
+def api_update_accessibility():
+    """Update accessibility settings via AJAX."""
+    user = get_current_user()
+    data = request.get_json()
+    
+    if 'font_size' in data:
+        user['accessibility']['font_size'] = data['font_size']
+    if 'high_contrast' in data:
+        user['accessibility']['high_contrast'] = data['high_contrast']
+    if 'voice_enabled' in data:
+        user['accessibility']['voice_enabled'] = data['voice_enabled']
+    if 'reduced_motion' in data:
+        user['accessibility']['reduced_motion'] = data['reduced_motion']
+    
+    return jsonify({'success': True, 'message': 'Settings updated'})
+
+@bp.route('/api/admin/analytics')
+@admin_required
+def api_admin_analytics():
+    """Daily trend series for charts, read from the rollups."""
+    days = request.args.get('days', analytics.DEFAULT_DAYS, type=int)
+    end = request.args.get('end')
+    try:
+        end = datetime.strptime(end, '%Y-%m-%d').date() if end else None
+    except ValueError:
+        return jsonify({'success': False, 'message': 'end must be YYYY-MM-DD'}), 400
+
+    return jsonify({'success': True, 'analytics': analytics.series(analytics_db, days, end)})
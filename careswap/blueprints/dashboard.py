@@ -0,0 +1,61 @@
+"""
+CareSwap - Dashboard Routes
+Senior and youth dashboards
+"""
+
+from flask import Blueprint, current_app, redirect, render_template, request, session, url_for
+
+from .. import archive
+from ..db import rating_book, request_archive, requests_db
+from ..decorators import login_required
+from ..helpers import get_current_user
+
+bp = Blueprint('dashboard', __name__)
+
+
+@bp.route('/dashboard/senior')
+@login_required
+def senior_dashboard():
+    """Senior dashboard."""
+    user = get_current_user()
+    if user['type'] != 'senior':
+        return redirect(url_for('dashboard.youth_dashboard'))
+    
+    my_requests = [r for r in requests_db if r['posted_by'] == session['user_email']]
+    past_count = request_archive.count_for_poster(session['user_email'])
+    return render_template('senior_dashboard.html', user=user, requests=my_requests, past_count=past_count,
+                           can_rate=rating_book.can_rate)
+
+@bp.route('/dashboard/senior/history')
+@login_required
+def senior_history():
+    """Paginated archive of a senior's past requests."""
+    user = get_current_user()
+    if user['type'] != 'senior':
+        return redirect(url_for('dashboard.youth_dashboard'))
+
+    total = request_archive.count_for_poster(session['user_email'])
+    pages = max(1, -(-total // archive.DEFAULT_PAGE_SIZE))
+    page = min(max(1, request.args.get('page', 1, type=int)), pages)
+    past_requests = request_archive.page_for_poster(session['user_email'], page)
+
+    return render_template('senior_history.html', user=user, requests=past_requests,
+                           page=page, pages=pages, archive_after_days=current_app.config['ARCHIVE_AFTER_DAYS'])
+
+@bp.route('/dashboard/youth')
+@login_required
+def youth_dashboard():
+    """Youth dashboard."""
+    user = get_current_user()
+    if user['type'] != 'youth':
+        return redirect(url_for('dashboard.senior_dashboard'))
+    
+    open_requests = [r for r in requests_db if r['status'] == 'Open' and r['posted_by'] != session['user_email']]
+    my_accepted = [r for r in requests_db if r.get('accepted_by') == session['user_email']]
+    
+    sort = request.args.get('sort', 'newest')
+    if sort == 'rating':
+        open_requests.sort(key=lambda r: rating_book.adjusted_score(r['posted_by']), reverse=True)
+    
+    return render_template('youth_dashboard.html', user=user, requests=open_requests, my_tasks=my_accepted, sort=sort,
+                           can_rate=rating_book.can_rate)
@@ -0,0 +1,142 @@
+"""
+CareSwap - Request Routes
+Posting, accepting, completing and rating help requests
+"""
+
+from datetime import datetime
+
+from flask import Blueprint, flash, redirect, render_template, request, session, url_for
+
+from .. import analytics, badges, ratings
+from ..catalog import points_map
+from ..db import analytics_db, rating_book, requests_db, users_db
+from ..decorators import login_required
+from ..helpers import find_request, get_current_user, next_request_id
+from ..state import get_state
+
+bp = Blueprint('requests', __name__)
+
+
+@bp.route('/request/new', methods=['GET', 'POST'])
+@login_required
+def post_request():
+    """Create a new help request."""
+    user = get_current_user()
+    
+    if request.method == 'POST':
+        # Calculate AURA points based on difficulty
+        difficulty = request.form.get('difficulty', 'Medium')
+        aura_points = points_map.get(difficulty, 50)
+        
+        new_request = {
+            'id': next_request_id(),
+            'title': request.form.get('title', ''),
+            'description': request.form.get('description', ''),
+            'category': request.form.get('category', 'general'),
+            'aura_points': aura_points,
+            'difficulty': difficulty,
+            'status': 'Open',
+            'user_type': 'CareSwap' if request.form.get('is_swap') else 'Senior',
+            'location': request.form.get('location', 'Online'),
+            'posted_by': session['user_email'],
+            'posted_date': datetime.now().strftime('%Y-%m-%d'),
+            'posted_at': datetime.now().isoformat(),
+            'accepted_by': None
+        }
+        
+        requests_db.append(new_request)
+        analytics.record_request_posted(analytics_db, new_request)
+        flash('Your request has been posted!', 'success')
+        
+        if user['type'] == 'senior':
+            return redirect(url_for('dashboard.senior_dashboard'))
+        return redirect(url_for('dashboard.youth_dashboard'))
+    
+    return render_template('post_request.html', user=user)
+
+@bp.route('/request/<int:request_id>/accept')
+@login_required
+def accept_request(request_id):
+    """Accept a help request."""
+    user = get_current_user()
+    
+    # Held so archiving cannot shift requests_db while it is searched
+    with get_state().write_lock:
+        for req in requests_db:
+            if req['id'] == request_id and req['status'] == 'Open':
+                if req['posted_by'] == session['user_email']:
+                    flash('You cannot accept your own request.', 'warning')
+                    break
+                req['status'] = 'In Progress'
+                req['accepted_by'] = session['user_email']
+                req['accepted_at'] = datetime.now().isoformat()
+                analytics.record_request_accepted(analytics_db, req)
+                
+                # Award points
+                user['aura_points'] += req['aura_points']
+                get_state().publish(badges.POINTS_CHANGED, email=session['user_email'])
+                
+                flash(f'Request accepted! You earned {req["aura_points"]} AURA points!', 'success')
+                break
+    
+    return redirect(url_for('dashboard.youth_dashboard'))
+
+@bp.route('/request/<int:request_id>/complete')
+@login_required
+def complete_request(request_id):
+    """Mark a request as completed."""
+    with get_state().write_lock:
+        for req in requests_db:
+            if req['id'] == request_id:
+                if req['status'] != 'Completed':
+                    # Only a task someone took on, closed by one of its two
+                    # sides, counts towards badges
+                    helped = (req['status'] == 'In Progress'
+                              and session['user_email'] in (req['posted_by'], req['accepted_by']))
+                    req['status'] = 'Completed'
+                    req['completed_at'] = datetime.now().isoformat()
+                    analytics.record_request_completed(analytics_db, req)
+                    if helped:
+                        get_state().publish(badges.REQUEST_COMPLETED, req=req)
+                        if req['user_type'] == 'CareSwap':
+                            get_state().publish(badges.SWAP_COMPLETED, req=req)
+                flash('Task marked as complete! Great job!', 'success')
+                
+                # Ask the participant to rate the other side straight away
+                if rating_book.can_rate(req, session['user_email']):
+                    return redirect(url_for('requests.rate_request', request_id=request_id))
+                break
+    
+    user = get_current_user()
+    if user['type'] == 'senior':
+        return redirect(url_for('dashboard.senior_dashboard'))
+    return redirect(url_for('dashboard.youth_dashboard'))
+
+@bp.route('/request/<int:request_id>/rate', methods=['GET', 'POST'])
+@login_required
+def rate_request(request_id):
+    """Rate the other participant of a completed request."""
+    user = get_current_user()
+    dashboard = url_for('dashboard.senior_dashboard') if user['type'] == 'senior' else url_for('dashboard.youth_dashboard')
+    
+    req = find_request(request_id)
+    if not req or not rating_book.can_rate(req, session['user_email']):
+        flash('This request cannot be rated.', 'warning')
+        return redirect(dashboard)
+    
+    ratee_email = req['accepted_by'] if session['user_email'] == req['posted_by'] else req['posted_by']
+    ratee = users_db.get(ratee_email)
+    
+    if request.method == 'POST':
+        stars = request.form.get('stars', type=int)
+        try:
+            rating_book.add(req, session['user_email'], stars, request.form.get('comment', ''))
+        except ratings.RatingError as e:
+            flash(str(e), 'danger')
+            return render_template('rate_request.html', user=user, req=req, ratee=ratee)
+        
+        get_state().publish(badges.RATING_RECEIVED, email=ratee_email, stars=stars)
+        flash('Thank you for your feedback!', 'success')
+        return redirect(dashboard)
+    
+    return render_template('rate_request.html', user=user, req=req, ratee=ratee)
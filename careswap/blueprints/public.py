@@ -0,0 +1,102 @@
+"""
+CareSwap - Public Routes
+Landing page, login, signup and logout
+"""
+
+from datetime import datetime
+
+from flask import Blueprint, flash, redirect, render_template, request, session, url_for
+
+from .. import analytics
+from ..db import analytics_db, request_archive, requests_db, users_db
+from ..helpers import build_user_record, is_user_accessible
+
+bp = Blueprint('public', __name__)
+
+
+@bp.route('/')
+def landing():
+    """Landing page."""
+    stats = {
+        'users': len(users_db),
+        'tasks': len(request_archive) + sum(1 for r in requests_db if r['status'] == 'Completed'),
+        'active_requests': sum(1 for r in requests_db if r['status'] == 'Open')
+    }
+    return render_template('landing.html', stats=stats)
+
+@bp.route('/login', methods=['GET', 'POST'])
+def login():
+    """User login page."""
+    if request.method == 'POST':
+        email = request.form.get('email', '').lower().strip()
+        password = request.form.get('password', '')
+        
+        if email in users_db and users_db[email]['password'] == password:
+            user = users_db[email]
+            
+            # Check if user is banned or timed out
+            accessible, message = is_user_accessible(user)
+            if not accessible:
+                flash(message, 'danger')
+                return render_template('login.html')
+            
+            # Set session
+            session['user_email'] = email
+            session['user_type'] = user['type']
+            session['user_name'] = user['name']
+            
+            # Update last active
+            user['last_active'] = datetime.now().isoformat()
+            
+            flash(f'Welcome back, {user["name"]}!', 'success')
+            
+            if user['type'] == 'senior':
+                return redirect(url_for('dashboard.senior_dashboard'))
+            else:
+                return redirect(url_for('dashboard.youth_dashboard'))
+        else:
+            flash('Invalid email or password. Please try again.', 'danger')
+    
+    return render_template('login.html')
+
+@bp.route('/signup', methods=['GET', 'POST'])
+def signup():
+    """User signup page."""
+    user_type = request.args.get('type', '')
+    
+    if request.method == 'POST':
+        email = request.form.get('email', '').lower().strip()
+        password = request.form.get('password', '')
+        name = request.form.get('name', '').strip()
+        user_type = request.form.get('user_type', 'youth')
+        
+        if email in users_db:
+            flash('Email already exists. Please login instead.', 'warning')
+            return redirect(url_for('public.login'))
+        
+        if len(password) < 6:
+            flash('Password must be at least 6 characters.', 'danger')
+            return render_template('signup.html', user_type=user_type)
+        
+        # Create new user
+        new_user = build_user_record(email, password, name, user_type)
+        
+        users_db[email] = new_user
+        analytics.record_signup(analytics_db, user_type)
+        
+        # Set session
+        session['user_email'] = email
+        session['user_type'] = user_type
+        session['user_name'] = name
+        
+        flash('Welcome to CareSwap! You earned 100 AURA points as a welcome bonus! 🎉', 'success')
+        return redirect(url_for('user.onboarding'))
+    
+    return render_template('signup.html', user_type=user_type)
+
+@bp.route('/logout')
+def logout():
+    """Logout user."""
+    session.clear()
+    flash('You have been logged out successfully.', 'info')
+    return redirect(url_for('public.landing'))
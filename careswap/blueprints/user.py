@@ -0,0 +1,130 @@
+"""
+CareSwap - User Routes
+Onboarding, profiles and settings
+"""
+
+from flask import Blueprint, flash, redirect, render_template, request, session, url_for
+
+from ..catalog import all_badges
+from ..db import users_db
+from ..decorators import login_required
+from ..helpers import get_current_user
+
+bp = Blueprint('user', __name__)
+
+
+@bp.route('/onboarding', methods=['GET', 'POST'])
+@login_required
+def onboarding():
+    """Onboarding page for new users."""
+    user = get_current_user()
+    
+    if request.method == 'POST':
+        # Update accessibility settings
+        user['accessibility']['font_size'] = request.form.get('font_size', 'medium')
+        user['accessibility']['high_contrast'] = request.form.get('high_contrast') == 'on'
+        user['accessibility']['voice_enabled'] = request.form.get('voice_enabled') == 'on'
+        
+        # Update bio
+        user['bio'] = request.form.get('bio', '')
+        
+        # Update skills
+        skills_teach = request.form.getlist('skills_teach')
+        skills_learn = request.form.getlist('skills_learn')
+        user['skills_teach'] = skills_teach
+        user['skills_learn'] = skills_learn
+        
+        flash('Setup complete! Start exploring CareSwap.', 'success')
+        
+        if user['type'] == 'senior':
+            return redirect(url_for('dashboard.senior_dashboard'))
+        else:
+            return redirect(url_for('dashboard.youth_dashboard'))
+    
+    return render_template('onboarding.html', user=user)
+
+@bp.route('/profile')
+@bp.route('/profile/<int:user_id>')
+@login_required
+def profile(user_id=None):
+    """User profile page."""
+    current_user = get_current_user()
+    
+    if user_id:
+        # Viewing another user's profile
+        target_user = None
+        for email, user in users_db.items():
+            if user['id'] == user_id:
+                target_user = user
+                break
+        
+        if not target_user:
+            flash('User not found.', 'danger')
+            return redirect(url_for('public.landing'))
+        
+        # Check privacy settings
+        visibility = target_user['privacy']['profile_visibility']
+        if visibility == 'private' and target_user['id'] != current_user['id']:
+            flash('This profile is private.', 'warning')
+            return redirect(url_for('public.landing'))
+        
+        return render_template('profile.html', user=target_user, is_own_profile=False, all_badges=all_badges)
+    
+    return render_template('profile.html', user=current_user, is_own_profile=True, all_badges=all_badges)
+
+@bp.route('/settings', methods=['GET', 'POST'])
+@login_required
+def settings():
+    """User settings page."""
+    user = get_current_user()
+    
+    if request.method == 'POST':
+        action = request.form.get('action', '')
+        
+        if action == 'accessibility':
+            user['accessibility']['font_size'] = request.form.get('font_size', 'medium')
+            user['accessibility']['high_contrast'] = request.form.get('high_contrast') == 'on'
+            user['accessibility']['voice_enabled'] = request.form.get('voice_enabled') == 'on'
+            user['accessibility']['reduced_motion'] = request.form.get('reduced_motion') == 'on'
+            flash('Accessibility settings updated!', 'success')
+        
+        elif action == 'account':
+            user['name'] = request.form.get('name', user['name'])
+            user['phone'] = request.form.get('phone', '')
+            user['bio'] = request.form.get('bio', '')
+            session['user_name'] = user['name']
+            flash('Account information updated!', 'success')
+        
+        elif action == 'privacy':
+            user['privacy']['profile_visibility'] = request.form.get('profile_visibility', 'registered')
+            user['privacy']['show_email'] = request.form.get('show_email') == 'on'
+            user['privacy']['show_phone'] = request.form.get('show_phone') == 'on'
+            user['privacy']['allow_contact'] = request.form.get('allow_contact') == 'on'
+            user['privacy']['show_activity'] = request.form.get('show_activity') == 'on'
+            flash('Privacy settings updated!', 'success')
+        
+        elif action == 'notifications':
+            user['notifications']['email_new_match'] = request.form.get('email_new_match') == 'on'
+            user['notifications']['email_messages'] = request.form.get('email_messages') == 'on'
+            user['notifications']['email_weekly'] = request.form.get('email_weekly') == 'on'
+            user['notifications']['app_all'] = request.form.get('app_all') == 'on'
+            flash('Notification preferences updated!', 'success')
+        
+        elif action == 'password':
+            current_password = request.form.get('current_password', '')
+            new_password = request.form.get('new_password', '')
+            confirm_password = request.form.get('confirm_password', '')
+            
+            if user['password'] != current_password:
+                flash('Current password is incorrect.', 'danger')
+            elif new_password != confirm_password:
+                flash('New passwords do not match.', 'danger')
+            elif len(new_password) < 6:
+                flash('Password must be at least 6 characters.', 'danger')
+            else:
+                user['password'] = new_password
+                flash('Password changed successfully!', 'success')
+        
+        return redirect(url_for('user.settings'))
+    
+    return render_template('settings.html', user=user)
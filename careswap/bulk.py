@@ -0,0 +1,317 @@
+"""
+CareSwap - Bulk Import / Export
+Streaming CSV/JSONL readers and writers for the mock databases
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+
+FORMATS = ('csv', 'jsonl')
+
+MIMETYPES = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson'
+}
+
+# Columns written for each dataset. Passwords are never exported, so a
+# users export cannot be re-imported as-is: every row would fail the
+# password check until a `password` column is added.
+EXPORT_FIELDS = {
+    'users': [
+        'id', 'email', 'name', 'type', 'phone', 'bio', 'aura_points', 'level',
+        'badges', 'rating', 'rating_count', 'completed_tasks', 'joined_date',
+        'last_active', 'status', 'timeout_until', 'ban_reason', 'accessibility',
+        'privacy', 'notifications', 'skills_teach', 'skills_learn'
+    ],
+    'requests': [
+        'id', 'title', 'description', 'category', 'aura_points', 'difficulty',
+        'status', 'user_type', 'location', 'posted_by', 'posted_date', 'accepted_by',
+        'posted_at', 'accepted_at', 'completed_at'
+    ],
+    'logs': ['timestamp', 'admin', 'action', 'target', 'details']
+}
+
+USER_TYPES = ('senior', 'youth')
+REQUEST_STATUSES = ('Open', 'In Progress', 'Completed')
+REQUEST_USER_TYPES = ('Senior', 'CareSwap')
+
+# Cells starting with these are run as formulas by spreadsheet apps
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+DEFAULT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 50
+
+
+class ImportRowError(ValueError):
+    """Raised when a single import row fails validation."""
+
+
+# ========================================
+# Export (generators)
+# ========================================
+
+def iter_records(dataset, users_db, requests_db, admin_logs):
+    """Yield records of a dataset one at a time without copying them."""
+    if dataset == 'users':
+        # Only the key list is snapshotted so concurrent signups cannot
+        # break iteration; records themselves are looked up lazily.
+        for email in list(users_db):
+            user = users_db.get(email)
+            if user is not None:
+                yield user
+    elif dataset == 'requests':
+        # Archiving removes requests in place, so walk a copy of the list
+        yield from list(requests_db)
+    elif dataset == 'logs':
+        # Append-only, so walk it by index up to the length seen at the
+        # start of the export.
+        for i in range(len(admin_logs)):
+            yield admin_logs[i]
+    else:
+        raise ValueError(f'Unknown dataset: {dataset}')
+
+
+def _csv_cell(value):
+    """Encode nested values as JSON so CSV cells round-trip."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if value is None:
+        return ''
+    # User-supplied text like "=HYPERLINK(...)" must not run as a formula
+    # when an admin opens the export; a leading quote forces plain text.
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_value(value):
+    """Undo the formula guard added by _csv_cell when reading CSV back."""
+    if isinstance(value, str) and value.startswith("'") and value[1:].startswith(FORMULA_PREFIXES):
+        return value[1:]
+    return value
+
+
+def stream_export(records, fmt, fields):
+    """Yield a dataset as CSV or JSONL text, one row per chunk."""
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        yield buffer.getvalue()
+        for record in records:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow([_csv_cell(record.get(field)) for field in fields])
+            yield buffer.getvalue()
+    elif fmt == 'jsonl':
+        for record in records:
+            row = {field: record.get(field) for field in fields}
+            yield json.dumps(row, ensure_ascii=False) + '\n'
+    else:
+        raise ValueError(f'Unknown format: {fmt}')
+
+
+# ========================================
+# Import (generators)
+# ========================================
+
+def iter_rows(stream, fmt):
+    """Yield (line_number, row_dict) pairs from a text stream."""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {field: _csv_value(value) for field, value in row.items()}
+    elif fmt == 'jsonl':
+        for line_num, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_num, ImportRowError(f'Invalid JSON: {e.msg}')
+                continue
+            if not isinstance(row, dict):
+                yield line_num, ImportRowError('Each line must be a JSON object')
+                continue
+            yield line_num, row
+    else:
+        raise ValueError(f'Unknown format: {fmt}')
+
+
+def _text(row, field, default=''):
+    value = row.get(field)
+    if value is None:
+        return default
+    return str(value).strip()
+
+
+def _list(row, field):
+    """Read a list field from JSONL (list) or CSV (JSON or ';'-separated)."""
+    value = row.get(field)
+    if value is None or value == '':
+        return []
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    value = str(value).strip()
+    if value.startswith('['):
+        try:
+            return [str(v).strip() for v in json.loads(value) if str(v).strip()]
+        except json.JSONDecodeError:
+            raise ImportRowError(f'Invalid list in "{field}"')
+    return [v.strip() for v in value.split(';') if v.strip()]
+
+
+def validate_user_row(row, users_db, pending):
+    """Validate an imported user row and return its normalised fields."""
+    email = _text(row, 'email').lower()
+    if not email or '@' not in email:
+        raise ImportRowError('A valid email is required')
+    if email in users_db or email in pending:
+        raise ImportRowError(f'Email already exists: {email}')
+
+    name = _text(row, 'name')
+    if not name:
+        raise ImportRowError('Name is required')
+
+    user_type = _text(row, 'type', 'senior').lower()
+    if user_type not in USER_TYPES:
+        raise ImportRowError(f'Type must be one of: {", ".join(USER_TYPES)}')
+
+    password = _text(row, 'password')
+    if len(password) < 6:
+        raise ImportRowError('Password must be at least 6 characters')
+
+    return {
+        'email': email,
+        'password': password,
+        'name': name,
+        'type': user_type,
+        'phone': _text(row, 'phone'),
+        'bio': _text(row, 'bio'),
+        'skills_teach': _list(row, 'skills_teach'),
+        'skills_learn': _list(row, 'skills_learn')
+    }
+
+
+def validate_request_row(row, users_db, points_map):
+    """Validate an imported help request row and return its fields."""
+    title = _text(row, 'title')
+    if not title:
+        raise ImportRowError('Title is required')
+
+    posted_by = _text(row, 'posted_by').lower()
+    if posted_by not in users_db:
+        raise ImportRowError(f'Unknown poster: {posted_by or "(blank)"}')
+
+    difficulty = _text(row, 'difficulty', 'Medium') or 'Medium'
+    if difficulty not in points_map:
+        raise ImportRowError(f'Difficulty must be one of: {", ".join(points_map)}')
+
+    status = _text(row, 'status', 'Open') or 'Open'
+    if status not in REQUEST_STATUSES:
+        raise ImportRowError(f'Status must be one of: {", ".join(REQUEST_STATUSES)}')
+
+    accepted_by = _text(row, 'accepted_by').lower() or None
+    if accepted_by and accepted_by not in users_db:
+        raise ImportRowError(f'Unknown helper: {accepted_by}')
+    if status != 'Open' and not accepted_by:
+        raise ImportRowError(f'{status} requests need accepted_by')
+
+    user_type = _text(row, 'user_type', 'Senior') or 'Senior'
+    if user_type not in REQUEST_USER_TYPES:
+        raise ImportRowError(f'user_type must be one of: {", ".join(REQUEST_USER_TYPES)}')
+
+    posted_date = _text(row, 'posted_date') or datetime.now().strftime('%Y-%m-%d')
+    try:
+        datetime.strptime(posted_date, '%Y-%m-%d')
+    except ValueError:
+        raise ImportRowError('posted_date must be YYYY-MM-DD')
+
+    return {
+        'title': title,
+        'description': _text(row, 'description'),
+        'category': _text(row, 'category', 'general') or 'general',
+        'aura_points': points_map[difficulty],
+        'difficulty': difficulty,
+        'status': status,
+        'user_type': user_type,
+        'location': _text(row, 'location', 'Online') or 'Online',
+        'posted_by': posted_by,
+        'posted_date': posted_date,
+        'accepted_by': accepted_by
+    }
+
+
+def validate_log_row(row):
+    """Validate an imported audit log row."""
+    timestamp = _text(row, 'timestamp')
+    try:
+        datetime.fromisoformat(timestamp)
+    except ValueError:
+        raise ImportRowError('timestamp must be an ISO 8601 datetime')
+
+    admin = _text(row, 'admin').lower()
+    action = _text(row, 'action').lower()
+    if not admin or not action:
+        raise ImportRowError('admin and action are required')
+
+    return {
+        'timestamp': timestamp,
+        'admin': admin,
+        'action': action,
+        'target': _text(row, 'target'),
+        'details': _text(row, 'details')
+    }
+
+
+def run_import(rows, validate, commit, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Validate rows and hand them to `commit` in batches.
+
+    `validate(row, pending)` returns a record or raises ImportRowError, where
+    `pending` holds the records of the batch not yet committed. Returns a
+    summary dict with imported/skipped counts and the first few errors.
+
+    A file that cannot be read any further (not UTF-8, broken CSV quoting)
+    stops the import: rows read before that point are still committed and
+    `summary['aborted']` says where and why it stopped.
+    """
+    summary = {'imported': 0, 'skipped': 0, 'errors': [], 'aborted': None}
+    batch = []
+    pending = {}
+    line_num = 0
+
+    try:
+        for line_num, row in rows:
+            try:
+                if isinstance(row, ImportRowError):
+                    raise row
+                record = validate(row, pending)
+            except ImportRowError as e:
+                summary['skipped'] += 1
+                if len(summary['errors']) < MAX_REPORTED_ERRORS:
+                    summary['errors'].append(f'Line {line_num}: {e}')
+                continue
+
+            batch.append(record)
+            if 'email' in record:
+                pending[record['email']] = record
+            if len(batch) >= batch_size:
+                commit(batch)
+                summary['imported'] += len(batch)
+                batch = []
+                pending = {}
+    except UnicodeDecodeError:
+        summary['aborted'] = f'Import stopped after line {line_num}: the file is not UTF-8 text'
+    except csv.Error as e:
+        summary['aborted'] = f'Import stopped after line {line_num}: {e}'
+
+    if batch:
+        commit(batch)
+        summary['imported'] += len(batch)
+
+    return summary
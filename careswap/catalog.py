@@ -0,0 +1,21 @@
+"""
+CareSwap - Catalog
+AURA point values and the badges users can earn
+"""
+
+# AURA points awarded per request difficulty
+points_map = {'Easy': 50, 'Medium': 70, 'Hard': 120}
+
+# Available Badges
+all_badges = {
+    'first_helper': {'name': 'First Helper', 'icon': '🌟', 'description': 'Completed your first help request'},
+    'tech_learner': {'name': 'Tech Learner', 'icon': '📱', 'description': 'Learned 5 tech skills'},
+    'tech_guru': {'name': 'Tech Guru', 'icon': '💻', 'description': 'Taught 10 tech sessions'},
+    'wisdom_sharer': {'name': 'Wisdom Sharer', 'icon': '📚', 'description': 'Shared traditional knowledge'},
+    'helper_star': {'name': 'Helper Star', 'icon': '⭐', 'description': 'Received 5-star ratings 10 times'},
+    'community_champion': {'name': 'Community Champion', 'icon': '🏆', 'description': 'Top helper of the month'},
+    'patient_teacher': {'name': 'Patient Teacher', 'icon': '🎓', 'description': 'Praised for patience 5 times'},
+    'super_helper': {'name': 'Super Helper', 'icon': '🦸', 'description': 'Completed 50 tasks'},
+    'first_swap': {'name': 'First Swap', 'icon': '🔄', 'description': 'Completed first skill swap'},
+    'social_butterfly': {'name': 'Social Butterfly', 'icon': '🦋', 'description': 'Connected with 10 users'}
+}
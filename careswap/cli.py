@@ -0,0 +1,77 @@
+"""
+CareSwap - CLI Commands
+flask export-data / import-data / snapshot-save
+"""
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from . import bulk
+from .helpers import export_dataset, import_dataset
+from .state import get_state
+
+
+@click.command('export-data')
+@click.argument('dataset', type=click.Choice(list(bulk.EXPORT_FIELDS)))
+@click.option('--format', 'fmt', type=click.Choice(bulk.FORMATS), default='jsonl', show_default=True)
+@click.option('--output', '-o', type=click.Path(dir_okay=False, allow_dash=True), default='-',
+              help='File to write to (defaults to stdout).')
+@with_appcontext
+def export_data_command(dataset, fmt, output):
+    """Stream users, requests or logs out as CSV/JSONL."""
+    get_state().load()
+    with click.open_file(output, 'w', encoding='utf-8', lazy=False) as f:
+        for chunk in export_dataset(dataset, fmt):
+            f.write(chunk)
+
+@click.command('import-data')
+@click.argument('dataset', type=click.Choice(list(bulk.EXPORT_FIELDS)))
+@click.argument('source', type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.option('--format', 'fmt', type=click.Choice(bulk.FORMATS), default=None,
+              help='Input format (guessed from the file extension by default).')
+@click.option('--batch-size', type=click.IntRange(min=1), default=bulk.DEFAULT_BATCH_SIZE, show_default=True)
+@with_appcontext
+def import_data_command(dataset, source, fmt, batch_size):
+    """Validate and load users, requests or logs from CSV/JSONL."""
+    fmt = fmt or source.rsplit('.', 1)[-1].lower()
+    if fmt not in bulk.FORMATS:
+        raise click.BadParameter('Use --format csv or --format jsonl.', param_hint='--format')
+
+    state = get_state()
+    state.load()
+    with click.open_file(source, 'r', encoding='utf-8-sig') as f:
+        summary = import_dataset(dataset, f, fmt, batch_size)
+
+    click.echo(f'Imported {summary["imported"]} {dataset}, skipped {summary["skipped"]}.')
+    for error in summary['errors']:
+        click.echo(error, err=True)
+
+    # The CLI runs in its own process, so persist the result for the server
+    if current_app.config['SNAPSHOT_PATH'] and summary['imported']:
+        state.save_snapshot()
+        click.echo(f'Snapshot updated at {current_app.config["SNAPSHOT_PATH"]}.')
+
+    if summary['aborted']:
+        raise click.ClickException(summary['aborted'])
+
+@click.command('snapshot-save')
+@click.option('--path', type=click.Path(dir_okay=False), default=None,
+              help='Snapshot file (defaults to CARESWAP_SNAPSHOT_PATH).')
+@with_appcontext
+def snapshot_save_command(path):
+    """Write a snapshot of all databases now."""
+    path = path or current_app.config['SNAPSHOT_PATH']
+    if not path:
+        raise click.UsageError('Set CARESWAP_SNAPSHOT_PATH or pass --path.')
+
+    state = get_state()
+    state.load()
+    size = state.save_snapshot(path)
+    click.echo(f'Wrote {size} bytes to {path}.')
+
+
+def register(app):
+    """Add the CLI commands to `app`."""
+    for command in (export_data_command, import_data_command, snapshot_save_command):
+        app.cli.add_command(command)
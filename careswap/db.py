@@ -0,0 +1,17 @@
+"""
+CareSwap - Database Accessors
+Proxies to the current app's databases and subsystems, for use in views
+"""
+
+from werkzeug.local import LocalProxy
+
+from .state import get_state
+
+users_db = LocalProxy(lambda: get_state().users_db)
+admins_db = LocalProxy(lambda: get_state().admins_db)
+requests_db = LocalProxy(lambda: get_state().requests_db)
+admin_logs = LocalProxy(lambda: get_state().admin_logs)
+analytics_db = LocalProxy(lambda: get_state().analytics_db)
+
+request_archive = LocalProxy(lambda: get_state().request_archive)
+rating_book = LocalProxy(lambda: get_state().rating_book)
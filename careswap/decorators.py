@@ -0,0 +1,40 @@
+"""
+CareSwap - Decorators
+Login and admin guards shared by the blueprints
+"""
+
+from functools import wraps
+
+from flask import flash, redirect, session, url_for
+
+from .helpers import get_current_user, is_user_accessible
+
+
+def login_required(f):
+    """Require user login to access route."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if 'user_email' not in session:
+            flash('Please log in to access this page.', 'warning')
+            return redirect(url_for('public.login'))
+        
+        user = get_current_user()
+        if user:
+            accessible, message = is_user_accessible(user)
+            if not accessible:
+                session.clear()
+                flash(message, 'danger')
+                return redirect(url_for('public.login'))
+        
+        return f(*args, **kwargs)
+    return decorated_function
+
+def admin_required(f):
+    """Require admin login to access route."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if 'admin_email' not in session:
+            flash('Admin access required.', 'warning')
+            return redirect(url_for('admin.admin_login'))
+        return f(*args, **kwargs)
+    return decorated_function
@@ -0,0 +1,29 @@
+"""
+CareSwap - Domain Events
+Minimal in-process publish/subscribe for decoupling routes from subsystems
+"""
+
+
+class EventBus:
+    """Per-application event bus; each app gets its own subscribers."""
+
+    def __init__(self):
+        self._subscribers = {}
+
+    def subscribe(self, event, handler=None):
+        """Register `handler` for `event`. Usable as a decorator."""
+        if handler is None:
+            return lambda f: self.subscribe(event, f)
+        self._subscribers.setdefault(event, []).append(handler)
+        return handler
+
+    def unsubscribe(self, event, handler):
+        """Remove a previously registered handler."""
+        handlers = self._subscribers.get(event, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event, **payload):
+        """Call every handler subscribed to `event` with the payload."""
+        for handler in list(self._subscribers.get(event, ())):
+            handler(**payload)
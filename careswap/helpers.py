@@ -0,0 +1,172 @@
+"""
+CareSwap - Helpers
+Session lookups, audit logging and bulk import/export glue
+"""
+
+from datetime import datetime
+
+from flask import session
+
+from . import analytics, archive, bulk
+from .catalog import points_map
+from .db import admin_logs, admins_db, analytics_db, request_archive, requests_db, users_db
+from .state import get_state
+
+
+def get_current_user():
+    """Get the current logged in user from session."""
+    if 'user_email' in session:
+        return users_db.get(session['user_email'])
+    return None
+
+def get_current_admin():
+    """Get the current logged in admin from session."""
+    if 'admin_email' in session:
+        return admins_db.get(session['admin_email'])
+    return None
+
+def is_user_accessible(user):
+    """Check if user can access the platform (not banned/timed out)."""
+    if user['status'] == 'banned':
+        return False, 'Your account has been banned.'
+    if user['status'] == 'timeout':
+        if user['timeout_until']:
+            timeout_end = datetime.fromisoformat(user['timeout_until'])
+            if datetime.now() < timeout_end:
+                remaining = timeout_end - datetime.now()
+                return False, f'Your account is in timeout. Access will be restored in {remaining.seconds // 3600} hours.'
+            else:
+                # Timeout expired, restore access
+                user['status'] = 'active'
+                user['timeout_until'] = None
+    return True, None
+
+def next_request_id():
+    """Next request id; requests_db stays in id order even after archiving."""
+    last_hot = requests_db[-1]['id'] if requests_db else 0
+    return max(last_hot, request_archive.max_id) + 1
+
+def find_request(request_id):
+    """Find a request by id in the hot list, falling back to the archive."""
+    with get_state().write_lock:
+        for req in requests_db:
+            if req['id'] == request_id:
+                return req
+    return request_archive.get(request_id)
+
+def log_admin_action(admin_email, action, target_user, details=''):
+    """Log an admin action for audit trail."""
+    admin_logs.append({
+        'timestamp': datetime.now().isoformat(),
+        'admin': admin_email,
+        'action': action,
+        'target': target_user,
+        'details': details
+    })
+    analytics.record_moderation(analytics_db, action)
+
+def build_user_record(email, password, name, user_type):
+    """Build a new user record with the default settings for their type."""
+    return {
+        'id': len(users_db) + 1,
+        'email': email,
+        'password': password,
+        'name': name,
+        'type': user_type,
+        'phone': '',
+        'bio': '',
+        'aura_points': 100,  # Welcome bonus
+        'level': 1,
+        'badges': [{'id': 'newcomer', 'name': 'Newcomer', 'icon': '🌱', 'earned': datetime.now().strftime('%Y-%m-%d')}],
+        'rating': 0,
+        'rating_count': 0,
+        'completed_tasks': 0,
+        'joined_date': datetime.now().strftime('%Y-%m-%d'),
+        'last_active': datetime.now().isoformat(),
+        'status': 'active',
+        'timeout_until': None,
+        'ban_reason': None,
+        'accessibility': {
+            'font_size': 'large' if user_type == 'senior' else 'medium',
+            'high_contrast': user_type == 'senior',
+            'voice_enabled': user_type == 'senior',
+            'reduced_motion': False
+        },
+        'privacy': {
+            'profile_visibility': 'registered',
+            'show_email': False,
+            'show_phone': False,
+            'allow_contact': True,
+            'show_activity': True
+        },
+        'notifications': {
+            'email_new_match': True,
+            'email_messages': True,
+            'email_weekly': False,
+            'app_all': True
+        },
+        'skills_teach': [],
+        'skills_learn': []
+    }
+
+
+# ========================================
+# Bulk Import / Export
+# ========================================
+
+def _commit_users(batch):
+    """Insert a validated batch of imported users."""
+    next_id = len(users_db) + 1
+    new_users = {}
+    for offset, fields in enumerate(batch):
+        user = build_user_record(fields['email'], fields['password'], fields['name'], fields['type'])
+        user['id'] = next_id + offset
+        user['phone'] = fields['phone']
+        user['bio'] = fields['bio']
+        user['skills_teach'] = fields['skills_teach']
+        user['skills_learn'] = fields['skills_learn']
+        new_users[user['email']] = user
+    users_db.update(new_users)
+    for user in new_users.values():
+        analytics.record_signup(analytics_db, user['type'])
+
+def _commit_requests(batch):
+    """Append a validated batch of imported help requests."""
+    next_id = next_request_id()
+    for offset, fields in enumerate(batch):
+        fields['id'] = next_id + offset
+    requests_db.extend(batch)
+    for req in batch:
+        analytics.record_request_posted(analytics_db, req)
+
+def _commit_logs(batch):
+    """Append a validated batch of imported audit log entries."""
+    admin_logs.extend(batch)
+    for log in batch:
+        analytics.record_moderation(analytics_db, log['action'], log['timestamp'])
+
+def export_dataset(dataset, fmt):
+    """Return a generator streaming a dataset as CSV or JSONL."""
+    if dataset == 'requests':
+        records = archive.iter_requests(requests_db, request_archive)
+    else:
+        records = bulk.iter_records(dataset, users_db, requests_db, admin_logs)
+    return bulk.stream_export(records, fmt, bulk.EXPORT_FIELDS[dataset])
+
+def import_dataset(dataset, stream, fmt, batch_size=bulk.DEFAULT_BATCH_SIZE):
+    """Validate and import rows from a text stream, returning a summary."""
+    rows = bulk.iter_rows(stream, fmt)
+
+    if dataset == 'users':
+        validate = lambda row, pending: bulk.validate_user_row(row, users_db, pending)
+        commit = _commit_users
+    elif dataset == 'requests':
+        validate = lambda row, pending: bulk.validate_request_row(row, users_db, points_map)
+        commit = _commit_requests
+    elif dataset == 'logs':
+        validate = lambda row, pending: bulk.validate_log_row(row)
+        commit = _commit_logs
+    else:
+        raise ValueError(f'Unknown dataset: {dataset}')
+
+    return bulk.run_import(rows, validate, commit, batch_size)
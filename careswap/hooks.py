@@ -0,0 +1,73 @@
+"""
+CareSwap - App Hooks
+Request hooks, template globals and error pages
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+from flask import render_template
+
+from .helpers import get_current_admin, get_current_user
+from .state import get_state
+
+# How often the running app checks for requests to archive
+ARCHIVE_CHECK_INTERVAL = timedelta(hours=6)
+
+
+def register(app):
+    """Attach the hooks, context processor and error handlers to `app`."""
+
+    # ========================================
+    # Request Hooks
+    # ========================================
+
+    @app.before_request
+    def load_state():
+        """Load the databases on the first request, not at import."""
+        get_state().load()
+
+    @app.before_request
+    def ensure_snapshot_writer():
+        """Start snapshotting on the first request served by this process."""
+        # Deferred to the first request so the debug reloader's parent
+        # process (and a pre-fork master) never runs the writer thread.
+        state = get_state()
+        if state.snapshot_writer is None:
+            state.start_snapshot_writer()
+
+    @app.before_request
+    def schedule_archiving():
+        """Periodically archive old completed requests in the background."""
+        state = get_state()
+        now = datetime.now()
+        if state.last_archive_check is None or now - state.last_archive_check >= ARCHIVE_CHECK_INTERVAL:
+            state.last_archive_check = now
+            threading.Thread(target=state.archive_old_requests, name='careswap-archive', daemon=True).start()
+
+    # ========================================
+    # Context Processors
+    # ========================================
+
+    @app.context_processor
+    def inject_globals():
+        """Inject global variables into all templates."""
+        return {
+            'current_user': get_current_user(),
+            'current_admin': get_current_admin(),
+            'now': datetime.now()
+        }
+
+    # ========================================
+    # Error Handlers
+    # ========================================
+
+    @app.errorhandler(404)
+    def not_found(e):
+        """404 error handler."""
+        return render_template('landing.html', error='Page not found'), 404
+
+    @app.errorhandler(500)
+    def server_error(e):
+        """500 error handler."""
+        return render_template('landing.html', error='Something went wrong'), 500
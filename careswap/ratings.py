@@ -0,0 +1,155 @@
+"""
+CareSwap - Ratings
+Individual post-completion ratings with incrementally maintained aggregates
+
+For every user the book keeps a running sum and count, plus a fixed-size
+window of recent ratings with its own running sum. The trust-weighted
+(Bayesian) score shrinks each user's mean towards the platform-wide mean,
+so one lucky 5-star rating cannot outrank a long, consistent record:
+
+    score = (PRIOR_WEIGHT * global_mean + sum) / (PRIOR_WEIGHT + count)
+
+All of these are O(1) to update and to read; ratings are never rescanned.
+"""
+
+import threading
+from collections import deque
+from datetime import datetime
+
+
+MIN_STARS = 1
+MAX_STARS = 5
+RECENT_WINDOW = 10
+PRIOR_WEIGHT = 5
+DEFAULT_PRIOR_MEAN = 4.0
+MAX_COMMENT_LENGTH = 500
+
+
+class RatingError(ValueError):
+    """Raised when a rating cannot be recorded."""
+
+
+class RatingBook:
+    """Stores ratings and keeps per-user and global aggregates current."""
+
+    def __init__(self, users_db, ratings_db, state_db, lock=None):
+        self.users_db = users_db
+        self.ratings_db = ratings_db      # append-only list of rating dicts
+        self.state_db = state_db          # {'global', 'users', 'rated'}, see seed()
+        # Pass the app's write lock so snapshots never split a rating from its aggregates
+        self._lock = lock if lock is not None else threading.Lock()
+        if not state_db:
+            self.seed()
+
+    def seed(self):
+        """Initialise aggregates from the rating fields users already carry."""
+        total = sum(u['rating'] * u['rating_count'] for u in self.users_db.values())
+        count = sum(u['rating_count'] for u in self.users_db.values())
+        self.state_db.clear()
+        self.state_db.update({
+            'global': {'sum': total, 'count': count},
+            'users': {},
+            'rated': set()    # (request id, rater) pairs already rated
+        })
+
+    # ----------------------------------------
+    # Aggregates
+    # ----------------------------------------
+
+    def _aggregate(self, email):
+        aggregate = self.state_db['users'].get(email)
+        if aggregate is None:
+            user = self.users_db.get(email, {})
+            aggregate = self.state_db['users'][email] = {
+                # Ratings that predate individual storage only count
+                # towards the all-time mean, not the recent window
+                'sum': user.get('rating', 0) * user.get('rating_count', 0),
+                'count': user.get('rating_count', 0),
+                'recent': deque(maxlen=RECENT_WINDOW),
+                'recent_sum': 0
+            }
+        return aggregate
+
+    def global_mean(self):
+        totals = self.state_db['global']
+        return totals['sum'] / totals['count'] if totals['count'] else DEFAULT_PRIOR_MEAN
+
+    def adjusted_score(self, email):
+        """Bayesian score used for ranking; unrated users get the global mean."""
+        aggregate = self.state_db['users'].get(email)
+        if aggregate is None:
+            user = self.users_db.get(email, {})
+            total = user.get('rating', 0) * user.get('rating_count', 0)
+            count = user.get('rating_count', 0)
+        else:
+            total, count = aggregate['sum'], aggregate['count']
+        return (PRIOR_WEIGHT * self.global_mean() + total) / (PRIOR_WEIGHT + count)
+
+    def recent_average(self, email):
+        """Average of the last RECENT_WINDOW ratings, or None."""
+        aggregate = self.state_db['users'].get(email)
+        if not aggregate or not aggregate['recent']:
+            return None
+        return aggregate['recent_sum'] / len(aggregate['recent'])
+
+    # ----------------------------------------
+    # Recording
+    # ----------------------------------------
+
+    def can_rate(self, req, rater):
+        """True if `rater` took part in the completed request and has not rated it."""
+        return (req['status'] == 'Completed'
+                and req.get('accepted_by') is not None
+                and req['accepted_by'] != req['posted_by']
+                and rater in (req['posted_by'], req['accepted_by'])
+                and (req['id'], rater) not in self.state_db['rated'])
+
+    def add(self, req, rater, stars, comment=''):
+        """Record a rating from one participant of a request for the other."""
+        if req['status'] != 'Completed':
+            raise RatingError('Only completed requests can be rated.')
+        if rater not in (req['posted_by'], req.get('accepted_by')) or not req.get('accepted_by'):
+            raise RatingError('Only the people involved in a request can rate it.')
+        if req['accepted_by'] == req['posted_by']:
+            raise RatingError('You cannot rate yourself.')
+        if not isinstance(stars, int) or not MIN_STARS <= stars <= MAX_STARS:
+            raise RatingError(f'Please choose between {MIN_STARS} and {MAX_STARS} stars.')
+
+        ratee = req['accepted_by'] if rater == req['posted_by'] else req['posted_by']
+        key = (req['id'], rater)
+
+        with self._lock:
+            if key in self.state_db['rated']:
+                raise RatingError('You have already rated this request.')
+
+            rating = {
+                'id': len(self.ratings_db) + 1,
+                'request_id': req['id'],
+                'rater': rater,
+                'ratee': ratee,
+                'stars': stars,
+                'comment': comment.strip()[:MAX_COMMENT_LENGTH],
+                'created_at': datetime.now().isoformat()
+            }
+            self.ratings_db.append(rating)
+            self.state_db['rated'].add(key)
+
+            aggregate = self._aggregate(ratee)
+            aggregate['sum'] += stars
+            aggregate['count'] += 1
+            recent = aggregate['recent']
+            if len(recent) == recent.maxlen:
+                aggregate['recent_sum'] -= recent[0]
+            recent.append(stars)
+            aggregate['recent_sum'] += stars
+
+            totals = self.state_db['global']
+            totals['sum'] += stars
+            totals['count'] += 1
+
+            user = self.users_db.get(ratee)
+            if user is not None:
+                user['rating'] = round(aggregate['sum'] / aggregate['count'], 2)
+                user['rating_count'] = aggregate['count']
+
+        return rating
@@ -0,0 +1,166 @@
+"""
+CareSwap - Seed Data
+Demo accounts and requests loaded into a fresh app with no snapshot
+"""
+
+from datetime import datetime
+
+
+def seed_users():
+    """Demo senior and youth accounts."""
+    return {
+        'senior@test.com': {
+            'id': 1,
+            'email': 'senior@test.com',
+            'password': 'password123',
+            'name': 'Mdm Tan Ah Lian',
+            'type': 'senior',
+            'phone': '+65 9123 4567',
+            'bio': 'Retired teacher who loves cooking traditional dishes. Looking forward to learning technology from the young generation!',
+            'aura_points': 550,
+            'level': 3,
+            'badges': [
+                {'id': 'first_helper', 'name': 'First Helper', 'icon': '🌟', 'earned': '2024-01-15'},
+                {'id': 'tech_learner', 'name': 'Tech Learner', 'icon': '📱', 'earned': '2024-02-20'},
+                {'id': 'wisdom_sharer', 'name': 'Wisdom Sharer', 'icon': '📚', 'earned': '2024-03-10'}
+            ],
+            'rating': 4.8,
+            'rating_count': 12,
+            'completed_tasks': 12,
+            'joined_date': '2024-01-10',
+            'last_active': datetime.now().isoformat(),
+            'status': 'active',  # active, banned, timeout
+            'timeout_until': None,
+            'ban_reason': None,
+            'accessibility': {
+                'font_size': 'large',
+                'high_contrast': False,
+                'voice_enabled': True,
+                'reduced_motion': False
+            },
+            'privacy': {
+                'profile_visibility': 'registered',  # public, registered, private
+                'show_email': False,
+                'show_phone': False,
+                'allow_contact': True,
+                'show_activity': True
+            },
+            'notifications': {
+                'email_new_match': True,
+                'email_messages': True,
+                'email_weekly': False,
+                'app_all': True
+            },
+            'skills_teach': ['Cooking', 'Dialect', 'History'],
+            'skills_learn': ['Smartphone', 'Social Media', 'Online Banking']
+        },
+        'youth@test.com': {
+            'id': 2,
+            'email': 'youth@test.com',
+            'password': 'password123',
+            'name': 'Alex Tan Wei Ming',
+            'type': 'youth',
+            'phone': '+65 8765 4321',
+            'bio': 'NUS Computer Science student passionate about helping seniors bridge the digital divide. Always happy to teach and learn!',
+            'aura_points': 1820,
+            'level': 8,
+            'badges': [
+                {'id': 'helper_star', 'name': 'Helper Star', 'icon': '⭐', 'earned': '2024-01-20'},
+                {'id': 'tech_guru', 'name': 'Tech Guru', 'icon': '💻', 'earned': '2024-02-15'},
+                {'id': 'community_champion', 'name': 'Community Champion', 'icon': '🏆', 'earned': '2024-03-01'},
+                {'id': 'patient_teacher', 'name': 'Patient Teacher', 'icon': '🎓', 'earned': '2024-03-15'}
+            ],
+            'rating': 4.9,
+            'rating_count': 35,
+            'completed_tasks': 35,
+            'joined_date': '2024-01-05',
+            'last_active': datetime.now().isoformat(),
+            'status': 'active',
+            'timeout_until': None,
+            'ban_reason': None,
+            'accessibility': {
+                'font_size': 'medium',
+                'high_contrast': False,
+                'voice_enabled': False,
+                'reduced_motion': False
+            },
+            'privacy': {
+                'profile_visibility': 'public',
+                'show_email': True,
+                'show_phone': False,
+                'allow_contact': True,
+                'show_activity': True
+            },
+            'notifications': {
+                'email_new_match': True,
+                'email_messages': True,
+                'email_weekly': True,
+                'app_all': True
+            },
+            'skills_teach': ['Technology', 'English', 'Social Media', 'Apps'],
+            'skills_learn': ['Cooking', 'Gardening', 'Life Skills']
+        }
+    }
+
+
+def seed_admins():
+    """Default super admin account."""
+    return {
+        'admin@careswap.sg': {
+            'id': 100,
+            'email': 'admin@careswap.sg',
+            'password': 'admin123',
+            'name': 'System Administrator',
+            'role': 'super_admin',  # super_admin, moderator
+            'permissions': ['ban', 'kick', 'timeout', 'view_reports', 'manage_content', 'manage_admins'],
+            'last_login': None
+        }
+    }
+
+
+def seed_requests():
+    """Open demo requests posted by the senior account."""
+    return [
+        {
+            'id': 1,
+            'title': 'Help me set up WhatsApp',
+            'description': 'I bought a new phone and don\'t know how to set up WhatsApp for my grandchildren. Need someone patient to teach me step by step.',
+            'category': 'technology',
+            'aura_points': 50,
+            'difficulty': 'Easy',
+            'status': 'Open',
+            'user_type': 'Senior',
+            'location': 'Online / Video Call',
+            'posted_by': 'senior@test.com',
+            'posted_date': '2024-12-08',
+            'accepted_by': None
+        },
+        {
+            'id': 2,
+            'title': 'Need help with heavy groceries',
+            'description': 'Cannot carry rice and oil back from the market. Need strong youth to help carry - will pay for transport.',
+            'category': 'errands',
+            'aura_points': 80,
+            'difficulty': 'Medium',
+            'status': 'Open',
+            'user_type': 'Senior',
+            'location': 'Blk 123 Tampines Ave 4',
+            'posted_by': 'senior@test.com',
+            'posted_date': '2024-12-07',
+            'accepted_by': None
+        },
+        {
+            'id': 3,
+            'title': 'Teach me basic phone camera + I teach you Hainanese Chicken Rice',
+            'description': 'Would like to learn how to take a clear photo of my cat. Can teach you how to cook authentic Hainanese Chicken Rice in return - secret family recipe!',
+            'category': 'skill_swap',
+            'aura_points': 120,
+            'difficulty': 'Medium',
+            'status': 'Open',
+            'user_type': 'CareSwap',
+            'location': 'My Home Kitchen (Bedok)',
+            'posted_by': 'senior@test.com',
+            'posted_date': '2024-12-06',
+            'accepted_by': None
+        }
+    ]
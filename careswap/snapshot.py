@@ -0,0 +1,256 @@
+"""
+CareSwap - State Snapshots
+Periodic binary snapshots of the in-memory databases for fast restarts
+
+File layout (little-endian):
+    header   magic (8s) | format version (H) | section count (H) | created (d)
+    index    per section: name length (B) | name | offset (Q) | length (Q) | crc32 (I)
+    body     one pickled object per section
+"""
+
+import gc
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+
+MAGIC = b'CSWSNAP\x00'
+FORMAT_VERSION = 1
+PICKLE_PROTOCOL = 5
+
+_HEADER = struct.Struct('<8sHHd')
+_ENTRY = struct.Struct('<QQI')
+
+DEFAULT_INTERVAL = 60
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, corrupt or incompatible."""
+
+
+# ========================================
+# Writing
+# ========================================
+
+def write_snapshot(path, sections):
+    """
+    Write `sections` (name -> dict/list) to `path` atomically.
+
+    The file is written next to the target and renamed into place, so a
+    crash mid-write leaves the previous snapshot intact. Returns the
+    number of bytes written.
+    """
+    payloads = []
+    for name, data in sections.items():
+        blob = pickle.dumps(data, protocol=PICKLE_PROTOCOL)
+        payloads.append((name.encode('utf-8'), blob))
+
+    index_size = sum(1 + len(name) + _ENTRY.size for name, _ in payloads)
+    offset = _HEADER.size + index_size
+
+    index = bytearray()
+    for name, blob in payloads:
+        index += struct.pack('<B', len(name)) + name
+        index += _ENTRY.pack(offset, len(blob), zlib.crc32(blob))
+        offset += len(blob)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # A unique temp name per writer, so two processes saving at once (two
+    # workers, or the CLI and the server) never share a half-written file
+    fd, tmp_path = tempfile.mkstemp(prefix=f'{os.path.basename(path)}.', suffix='.tmp', dir=directory)
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(payloads), time.time()))
+            f.write(index)
+            for _, blob in payloads:
+                f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # Persist the rename itself, not just the file contents
+    if os.name == 'posix':
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    return offset
+
+
+# ========================================
+# Reading
+# ========================================
+
+def read_snapshot(path):
+    """Load every section of a snapshot file through a read-only mmap."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER.size:
+            raise SnapshotError(f'Snapshot too small: {path}')
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, count, created = _HEADER.unpack_from(mm, 0)
+            if magic != MAGIC:
+                raise SnapshotError(f'Not a CareSwap snapshot: {path}')
+            if version != FORMAT_VERSION:
+                raise SnapshotError(f'Unsupported snapshot version {version}')
+
+            entries = []
+            pos = _HEADER.size
+            for _ in range(count):
+                name_len = mm[pos]
+                name = mm[pos + 1:pos + 1 + name_len].decode('utf-8')
+                pos += 1 + name_len
+                offset, length, crc = _ENTRY.unpack_from(mm, pos)
+                pos += _ENTRY.size
+                if offset + length > size:
+                    raise SnapshotError(f'Section "{name}" is truncated')
+                entries.append((name, offset, length, crc))
+
+            # Unpickling allocates millions of containers; pausing the cyclic
+            # GC avoids repeated full collections over the growing heap.
+            sections = {}
+            view = memoryview(mm)
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                for name, offset, length, crc in entries:
+                    blob = view[offset:offset + length]
+                    if zlib.crc32(blob) != crc:
+                        raise SnapshotError(f'Checksum mismatch in section "{name}"')
+                    sections[name] = pickle.loads(blob)
+                    blob.release()
+            finally:
+                view.release()
+                if gc_was_enabled:
+                    gc.enable()
+
+    return sections, created
+
+
+def restore_snapshot(path, targets):
+    """
+    Restore a snapshot into existing containers in place.
+
+    `targets` maps section names to the live dicts/lists; they are
+    cleared and refilled so every module holding a reference sees the
+    restored data. Sections missing from the file are left untouched.
+    Returns the snapshot's creation time.
+    """
+    sections, created = read_snapshot(path)
+    for name, target in targets.items():
+        if name not in sections:
+            continue
+        if isinstance(target, dict):
+            target.clear()
+            target.update(sections[name])
+        else:
+            target[:] = sections[name]
+    return created
+
+
+# ========================================
+# Background Writer
+# ========================================
+
+class SnapshotWriter:
+    """
+    Daemon thread that snapshots the databases every `interval` seconds.
+
+    Where fork() is available the snapshot is pickled and written by a
+    child process (like Redis' BGSAVE): the child gets a copy-on-write
+    view of the heap, so serving only pauses for the fork itself rather
+    than for the whole pickle. `lock`, if given, is held across the fork
+    (or the in-process write) so multi-step updates made under it, such
+    as a rating and its aggregates, land in the snapshot together.
+    """
+
+    def __init__(self, path, sections, interval=DEFAULT_INTERVAL, logger=None, lock=None):
+        self.path = path
+        self.sections = sections
+        self.interval = interval
+        self.logger = logger
+        self.lock = lock if lock is not None else threading.Lock()
+        self.use_fork = hasattr(os, 'fork')
+        self.last_written = None
+        self._stop = threading.Event()
+        self._save_lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Start the background thread if it is not already running."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='careswap-snapshot', daemon=True)
+            self._thread.start()
+
+    def stop(self, final_snapshot=True):
+        """Stop the thread, optionally writing one last snapshot."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if final_snapshot:
+            self.save()
+
+    def save(self):
+        """Write a snapshot now. Returns False if the write failed."""
+        with self._save_lock:
+            started = time.perf_counter()
+            try:
+                if self.use_fork:
+                    self._save_forked()
+                else:
+                    with self.lock:
+                        write_snapshot(self.path, self.sections)
+                size = os.path.getsize(self.path)
+            except (OSError, RuntimeError, pickle.PicklingError) as e:
+                if self.logger:
+                    self.logger.warning('Snapshot to %s failed: %s', self.path, e)
+                return False
+
+            self.last_written = time.time()
+            if self.logger:
+                self.logger.info('Snapshot written to %s (%d bytes, %.2fs)',
+                                 self.path, size, time.perf_counter() - started)
+            return True
+
+    def _save_forked(self):
+        """Write the snapshot from a forked child and wait for it."""
+        with self.lock:
+            pid = os.fork()
+        if pid == 0:
+            # Child: only the forking thread survives, so avoid anything
+            # that may need a lock another thread held (logging included).
+            code = 0
+            try:
+                gc.disable()    # collections would only dirty shared pages
+                write_snapshot(self.path, self.sections)
+            except BaseException as e:
+                os.write(2, f'Snapshot to {self.path} failed: {e!r}\n'.encode('utf-8', 'replace'))
+                code = 1
+            finally:
+                os._exit(code)
+
+        # waitpid releases the GIL, so requests keep running meanwhile
+        _, status = os.waitpid(pid, 0)
+        code = os.waitstatus_to_exitcode(status)
+        if code != 0:
+            raise OSError(f'snapshot child exited with status {code}')
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.save()
@@ -0,0 +1,194 @@
+"""
+CareSwap - Application State
+Per-app databases with subsystems that start on first use
+"""
+
+import atexit
+import os
+import threading
+from datetime import datetime
+
+from flask import current_app
+
+from . import analytics, archive, badges, events, ratings, seed, snapshot
+from .catalog import all_badges
+
+
+class CareSwapState:
+    """Databases and subsystems owned by one app instance."""
+
+    def __init__(self, app):
+        self.app = app
+
+        # Mock Database, filled by load()
+        self.users_db = {}
+        self.admins_db = {}
+        self.requests_db = []
+        self.admin_logs = []
+        self.analytics_db = {}       # day -> counters, see analytics.py
+        self.achievements_db = {}    # email -> badge counters, see badges.py
+        self.ratings_db = []         # individual ratings, see ratings.py
+        self.rating_stats_db = {}    # their running aggregates
+
+        # Held by multi-step writers (ratings, badges), by request lookups
+        # and by snapshots, so a snapshot is always a consistent cut across
+        # the databases and archiving never shifts a list being searched
+        self.write_lock = threading.RLock()
+
+        self.events = events.EventBus()
+        self.snapshot_writer = None
+        self.archive_lock = threading.Lock()
+        self.last_archive_check = None
+
+        self._loaded = False
+        self._request_archive = None
+        self._badge_engine = None
+        self._rating_book = None
+        self._lock = threading.RLock()
+
+    @property
+    def snapshot_sections(self):
+        return {
+            'users_db': self.users_db,
+            'requests_db': self.requests_db,
+            'admins_db': self.admins_db,
+            'admin_logs': self.admin_logs,
+            'analytics_db': self.analytics_db,
+            'achievements_db': self.achievements_db,
+            'ratings_db': self.ratings_db,
+            'rating_stats_db': self.rating_stats_db
+        }
+
+    # ----------------------------------------
+    # Loading
+    # ----------------------------------------
+
+    def load(self):
+        """Restore the last snapshot or seed demo data, once per app."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+
+            if not self.restore() and self.app.config['LOAD_SEED_DATA']:
+                self.users_db.update(seed.seed_users())
+                self.admins_db.update(seed.seed_admins())
+                self.requests_db.extend(seed.seed_requests())
+
+            if self.app.config['ARCHIVE_PATH'] and not self.app.config['SNAPSHOT_PATH'] and len(self.request_archive):
+                self.app.logger.warning('Archive %s outlives the in-memory state (no SNAPSHOT_PATH); '
+                                        'reloaded requests may reuse archived ids', self.app.config['ARCHIVE_PATH'])
+
+            # First boot (or a snapshot from before rollups existed): backfill once
+            if not self.analytics_db:
+                analytics.rebuild(self.analytics_db, self.users_db,
+                                  archive.iter_requests(self.requests_db, self.request_archive),
+                                  self.admin_logs)
+            self._loaded = True
+
+    def restore(self):
+        """Restore the databases from the last snapshot, if there is one."""
+        path = self.app.config['SNAPSHOT_PATH']
+        if not path or not os.path.exists(path):
+            return False
+
+        started = datetime.now()
+        try:
+            created = snapshot.restore_snapshot(path, self.snapshot_sections)
+        except (OSError, snapshot.SnapshotError) as e:
+            self.app.logger.error('Could not restore snapshot %s: %s', path, e)
+            return False
+
+        self.app.logger.info('Restored snapshot from %s in %.2fs (%d users, %d requests)',
+                             datetime.fromtimestamp(created).isoformat(timespec='seconds'),
+                             (datetime.now() - started).total_seconds(),
+                             len(self.users_db), len(self.requests_db))
+        return True
+
+    def preload(self):
+        """Load data and start every subsystem up front (pre-fork servers)."""
+        self.load()
+        self.rating_book
+        self.badge_engine
+
+    # ----------------------------------------
+    # Subsystems
+    # ----------------------------------------
+
+    @property
+    def request_archive(self):
+        """Archived (completed) requests, kept out of requests_db."""
+        if self._request_archive is None:
+            with self._lock:
+                if self._request_archive is None:
+                    self._request_archive = archive.RequestArchive(self.app.config['ARCHIVE_PATH'],
+                                                                   logger=self.app.logger)
+        return self._request_archive
+
+    @property
+    def rating_book(self):
+        if self._rating_book is None:
+            self.load()
+            with self._lock:
+                if self._rating_book is None:
+                    self._rating_book = ratings.RatingBook(self.users_db, self.ratings_db, self.rating_stats_db,
+                                                      lock=self.write_lock)
+        return self._rating_book
+
+    @property
+    def badge_engine(self):
+        if self._badge_engine is None:
+            self.load()
+            with self._lock:
+                if self._badge_engine is None:
+                    engine = badges.BadgeEngine(self.users_db, self.achievements_db, all_badges, lock=self.write_lock)
+                    engine.register(self.events)
+                    self._badge_engine = engine
+        return self._badge_engine
+
+    def publish(self, event, **payload):
+        """Publish a domain event, starting the subscribers first."""
+        self.badge_engine
+        self.events.publish(event, **payload)
+
+    # ----------------------------------------
+    # Background Work
+    # ----------------------------------------
+
+    def start_snapshot_writer(self):
+        """Start the background snapshot thread once per process."""
+        if self.snapshot_writer is not None or not self.app.config['SNAPSHOT_PATH']:
+            return
+
+        with self._lock:
+            if self.snapshot_writer is not None:
+                return
+            self.snapshot_writer = snapshot.SnapshotWriter(self.app.config['SNAPSHOT_PATH'], self.snapshot_sections,
+                                                           interval=self.app.config['SNAPSHOT_INTERVAL'],
+                                                           logger=self.app.logger, lock=self.write_lock)
+            self.snapshot_writer.start()
+            atexit.register(self.snapshot_writer.stop)
+
+    def save_snapshot(self, path=None):
+        """Write a snapshot of all databases now, returning its size."""
+        with self.write_lock:
+            return snapshot.write_snapshot(path or self.app.config['SNAPSHOT_PATH'], self.snapshot_sections)
+
+    def archive_old_requests(self, older_than_days=None):
+        """Move completed requests past the configured age into the archive."""
+        if older_than_days is None:
+            older_than_days = self.app.config['ARCHIVE_AFTER_DAYS']
+
+        with self.archive_lock:
+            moved = archive.archive_completed(self.requests_db, self.request_archive, older_than_days,
+                                               lock=self.write_lock)
+        if moved:
+            self.app.logger.info('Archived %d completed requests (%d in archive, %d still hot)',
+                                 moved, len(self.request_archive), len(self.requests_db))
+        return moved
+
+
+def get_state(app=None):
+    """The CareSwapState of `app`, or of the current app."""
+    return (app or current_app).extensions['careswap']
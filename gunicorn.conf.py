@@ -0,0 +1,42 @@
+"""
+CareSwap - Gunicorn Config
+Pre-fork serving with the app preloaded in the master
+
+    gunicorn app:app
+
+The master builds the app and loads the databases once (PRELOAD), then
+freezes those objects out of the garbage collector before forking, so
+workers start warm and keep sharing the preloaded pages copy-on-write
+instead of each rebuilding (and dirtying) their own copy.
+
+The databases are still per-process: every worker starts from the same
+data but its writes are its own. Keep WEB_CONCURRENCY=1 (scale with
+threads) when writes must be visible across requests or when snapshots
+are enabled, since each worker would otherwise write its own snapshot.
+
+The request archive file is shared by all workers, and each worker runs
+its own archiving pass over its own copy of the requests. Appends take
+an exclusive file lock and first index blocks written by other workers,
+so blocks never interleave and an id is only archived once. The first
+worker to archive a request wins, even if another worker's copy has
+diverged since the fork.
+"""
+
+import gc
+import os
+
+os.environ.setdefault('CARESWAP_PRELOAD', '1')
+
+bind = os.environ.get('CARESWAP_BIND', '127.0.0.1:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+threads = int(os.environ.get('CARESWAP_THREADS', 4))
+preload_app = True
+
+# No collections while the app is preloaded; everything loaded is frozen below
+gc.disable()
+
+
+def when_ready(server):
+    """Move the preloaded heap to the permanent generation before forking."""
+    gc.freeze()
+    gc.enable()
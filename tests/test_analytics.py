@@ -0,0 +1,76 @@
+"""
+Tests: daily rollups and the trends dashboard
+"""
+
+import re
+from datetime import date
+
+import pytest
+
+from careswap import analytics, create_app
+from careswap.state import get_state
+
+
+@pytest.fixture(autouse=True)
+def no_env_config(monkeypatch):
+    for name in ('CARESWAP_SNAPSHOT_PATH', 'CARESWAP_ARCHIVE_PATH', 'CARESWAP_PRELOAD'):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def app():
+    return create_app({'TESTING': True})
+
+
+def admin_client(app):
+    client = app.test_client()
+    client.post('/admin/login', data={'email': 'admin@careswap.sg', 'password': 'admin123'})
+    return client
+
+
+def bar_groups(html):
+    """(title, {event: height}) for each day in the requests chart."""
+    groups = re.findall(r'<div class="bar-group" title="([^"]*)">(.*?)</div>\s*</div>', html, re.S)
+    return [(title, {event: float(height) for event, height in
+                     re.findall(r'class="bar (\w+)" style="height: ([\d.]+)%', bars)})
+            for title, bars in groups]
+
+
+def test_posting_a_request_updates_todays_rollup(app):
+    client = app.test_client()
+    client.post('/login', data={'email': 'senior@test.com', 'password': 'password123'})
+    before = get_state(app).analytics_db.get(date.today().isoformat(), {}).get('requests', {}).get('posted', 0)
+
+    client.post('/request/new', data={'title': 'Read my mail', 'difficulty': 'Easy'})
+
+    bucket = get_state(app).analytics_db[date.today().isoformat()]
+    assert bucket['requests']['posted'] == before + 1
+    assert bucket['by_difficulty']['Easy']['posted'] >= 1
+
+
+def test_todays_bar_shows_todays_counts(app):
+    client = app.test_client()
+    client.post('/login', data={'email': 'senior@test.com', 'password': 'password123'})
+    for n in range(4):
+        client.post('/request/new', data={'title': f'Errand {n}', 'difficulty': 'Easy'})
+
+    trends = analytics.series(get_state(app).analytics_db, 7)
+    peak = max(max(trends['requests'][event]) for event in analytics.REQUEST_EVENTS)
+    html = admin_client(app).get('/admin/analytics?days=7').get_data(as_text=True)
+
+    groups = bar_groups(html)
+    assert len(groups) == 7
+    title, heights = groups[-1]
+    posted = trends['requests']['posted'][-1]
+    assert posted >= 4
+    assert title.startswith(f'{date.today().isoformat()}: {posted} posted')
+    assert heights['posted'] == round(posted / peak * 100, 1)
+    for (_, heights), counts in zip(groups, zip(*(trends['requests'][e] for e in analytics.REQUEST_EVENTS))):
+        assert [heights[e] for e in analytics.REQUEST_EVENTS] == [round(c / peak * 100, 1) for c in counts]
+
+
+@pytest.mark.parametrize('days', [1, 2])
+def test_short_ranges_render(app, days):
+    response = admin_client(app).get(f'/admin/analytics?days={days}')
+    assert response.status_code == 200
+    assert len(bar_groups(response.get_data(as_text=True))) == days
@@ -0,0 +1,59 @@
+"""
+Tests: app factory isolation and lazy loading
+"""
+
+import pytest
+
+from careswap import create_app
+from careswap.state import get_state
+
+
+@pytest.fixture(autouse=True)
+def no_env_config(monkeypatch):
+    for name in ('CARESWAP_SNAPSHOT_PATH', 'CARESWAP_ARCHIVE_PATH', 'CARESWAP_PRELOAD'):
+        monkeypatch.delenv(name, raising=False)
+
+
+def login(client, email):
+    return client.post('/login', data={'email': email, 'password': 'password123'})
+
+
+def test_apps_do_not_share_data():
+    first = create_app({'TESTING': True})
+    second = create_app({'TESTING': True})
+
+    client = first.test_client()
+    login(client, 'senior@test.com')
+    client.post('/request/new', data={'title': 'Fix my radio', 'difficulty': 'Easy'})
+    second.test_client().get('/')
+
+    assert [r['title'] for r in get_state(first).requests_db][-1] == 'Fix my radio'
+    assert 'Fix my radio' not in [r['title'] for r in get_state(second).requests_db]
+    assert get_state(first).users_db is not get_state(second).users_db
+
+
+def test_data_loads_on_first_request():
+    app = create_app({'TESTING': True})
+    state = get_state(app)
+    assert not state.users_db
+
+    app.test_client().get('/')
+    assert 'senior@test.com' in state.users_db
+
+
+def test_seed_data_can_be_skipped():
+    app = create_app({'TESTING': True, 'LOAD_SEED_DATA': False})
+    assert app.test_client().get('/').status_code == 200
+    assert not get_state(app).users_db
+
+
+def test_archive_stays_in_memory_without_a_snapshot():
+    app = create_app({'TESTING': True})
+    assert app.config['ARCHIVE_PATH'] is None
+    assert get_state(app).request_archive.path is None
+
+
+def test_archive_lives_next_to_the_snapshot(tmp_path):
+    snapshot_path = str(tmp_path / 'state.snapshot')
+    app = create_app({'TESTING': True, 'SNAPSHOT_PATH': snapshot_path})
+    assert app.config['ARCHIVE_PATH'] == f'{snapshot_path}.archive'
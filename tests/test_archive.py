@@ -0,0 +1,191 @@
+"""
+Tests: request archive format, recovery and archiving pass
+"""
+
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from careswap import archive
+
+
+def make_request(request_id, status='Completed', poster='senior@test.com', days_ago=60):
+    finished = (datetime.now() - timedelta(days=days_ago)).isoformat()
+    return {
+        'id': request_id,
+        'title': f'Request {request_id}',
+        'status': status,
+        'posted_by': poster,
+        'posted_date': finished[:10],
+        'accepted_by': 'youth@test.com' if status != 'Open' else None,
+        'completed_at': finished if status == 'Completed' else None
+    }
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'requests.archive')
+
+
+def side_files(path):
+    directory, name = os.path.split(path)
+    return [f for f in os.listdir(directory) if f.startswith(f'{name}.corrupt-')]
+
+
+def test_round_trip(path):
+    store = archive.RequestArchive(path)
+    store.append([make_request(i) for i in range(1, 301)])
+
+    reopened = archive.RequestArchive(path)
+    assert len(reopened) == 300
+    assert reopened.max_id == 300
+    assert reopened.get(42)['title'] == 'Request 42'
+    assert [r['id'] for r in reopened.page_for_poster('senior@test.com')] == list(range(300, 290, -1))
+    assert sum(1 for _ in reopened.iter_records()) == 300
+
+
+def test_in_memory_archive():
+    store = archive.RequestArchive()
+    store.append([make_request(1), make_request(2)])
+    assert store.get(2)['title'] == 'Request 2'
+    assert [r['id'] for r in store.iter_records()] == [1, 2]
+
+
+def test_torn_tail_is_set_aside(path):
+    archive.RequestArchive(path).append([make_request(1), make_request(2)])
+    good_size = os.path.getsize(path)
+    archive.RequestArchive(path).append([make_request(3)])
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 5)
+
+    store = archive.RequestArchive(path)
+    assert len(store) == 2 and 3 not in store
+    assert os.path.getsize(path) == good_size
+    assert len(side_files(path)) == 1
+
+    # Appends continue on a block boundary
+    store.append([make_request(3)])
+    assert archive.RequestArchive(path).get(3)['id'] == 3
+
+
+@pytest.mark.parametrize('garbage', [b'garbage' * 50, b'CS'])
+def test_garbage_after_valid_blocks(path, garbage):
+    archive.RequestArchive(path).append([make_request(1), make_request(2)])
+    with open(path, 'ab') as f:
+        f.write(garbage)
+
+    store = archive.RequestArchive(path)
+    assert sorted(r['id'] for r in store.iter_records()) == [1, 2]
+    store.append([make_request(3)])
+    assert len(archive.RequestArchive(path)) == 3
+
+
+def test_corrupt_block_mid_file_stops_indexing(path):
+    archive.RequestArchive(path).append([make_request(1)])
+    with open(path, 'ab') as f:
+        f.write(b'\x00' * 64)
+    size = os.path.getsize(path)
+    # A valid block written after the garbage by a careless writer
+    other = archive.RequestArchive(str(path) + '.other')
+    other.append([make_request(2)])
+    with open(path, 'ab') as f, open(other.path, 'rb') as src:
+        f.write(src.read())
+
+    store = archive.RequestArchive(path)
+    assert 1 in store and 2 not in store
+    assert os.path.getsize(path) < size
+    with open(os.path.join(os.path.dirname(path), side_files(path)[0]), 'rb') as f:
+        assert f.read().startswith(b'\x00' * 64)
+
+
+def test_bad_payload_checksum_is_skipped(path):
+    store = archive.RequestArchive(path)
+    store.append([make_request(i) for i in range(1, 4)])
+    with open(path, 'r+b') as f:
+        f.seek(-3, os.SEEK_END)
+        f.write(b'\xff\xff\xff')
+
+    store = archive.RequestArchive(path)
+    assert len(store) == 3
+    assert store.get(1) is None
+    assert list(store.iter_records()) == []
+    assert store.page_for_poster('senior@test.com') == []
+
+
+def test_archive_completed_moves_only_old_completed(path):
+    store = archive.RequestArchive(path)
+    requests_db = [make_request(1), make_request(2, days_ago=1), make_request(3, status='Open')]
+
+    assert archive.archive_completed(requests_db, store, older_than_days=30) == 1
+    assert [r['id'] for r in requests_db] == [2, 3]
+    assert store.get(1)['title'] == 'Request 1'
+
+
+def test_archive_completed_drops_exact_duplicates(path):
+    store = archive.RequestArchive(path)
+    req = make_request(1)
+    store.append([req])
+    requests_db = [dict(req)]     # left behind by a crash before the prune
+
+    assert archive.archive_completed(requests_db, store) == 1
+    assert requests_db == []
+
+
+def test_archive_completed_keeps_hot_requests_reusing_an_id(path):
+    store = archive.RequestArchive(path)
+    store.append([make_request(1)])
+    # Seed data reloaded next to an older archive reuses id 1
+    reloaded = make_request(1, status='Open')
+    requests_db = [reloaded]
+
+    assert archive.archive_completed(requests_db, store) == 0
+    assert requests_db == [reloaded]
+
+    reloaded['status'] = 'Completed'
+    reloaded['title'] = 'Something else'
+    assert archive.archive_completed(requests_db, store) == 0
+    assert requests_db == [reloaded]
+
+
+def test_archive_completed_waits_for_lookups(path):
+    store = archive.RequestArchive(path)
+    requests_db = [make_request(1), make_request(2, status='Open')]
+    lock = threading.RLock()
+
+    with lock:
+        # A lookup holding the lock sees the list unchanged until it is done
+        worker = threading.Thread(target=archive.archive_completed, args=(requests_db, store),
+                                  kwargs={'lock': lock})
+        worker.start()
+        worker.join(timeout=0.2)
+        assert worker.is_alive()
+        assert [r['id'] for r in requests_db] == [1, 2]
+
+    worker.join()
+    assert [r['id'] for r in requests_db] == [2]
+    assert store.get(1)['title'] == 'Request 1'
+
+
+def test_iter_requests_counts_each_request_once(path):
+    store = archive.RequestArchive(path)
+    req = make_request(1)
+    store.append([req])
+    requests_db = [dict(req), make_request(1, status='Open'), make_request(2, status='Open')]
+
+    assert len(list(archive.iter_requests(requests_db, store))) == 3
+
+
+def test_writers_sharing_a_file_do_not_duplicate(path):
+    # Two workers opened the archive before either wrote to it
+    first = archive.RequestArchive(path)
+    second = archive.RequestArchive(path)
+
+    assert first.append([make_request(1), make_request(2)]) == 2
+    assert second.append([make_request(2), make_request(3)]) == 1
+    assert second.get(1)['id'] == 1
+
+    reopened = archive.RequestArchive(path)
+    assert sorted(r['id'] for r in reopened.iter_records()) == [1, 2, 3]
+    assert side_files(path) == []
@@ -0,0 +1,74 @@
+"""
+Tests: badges are only earned for completions someone helped with
+"""
+
+import pytest
+
+from careswap import create_app
+from careswap.state import get_state
+
+
+@pytest.fixture(autouse=True)
+def no_env_config(monkeypatch):
+    for name in ('CARESWAP_SNAPSHOT_PATH', 'CARESWAP_ARCHIVE_PATH', 'CARESWAP_PRELOAD'):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def app():
+    return create_app({'TESTING': True})
+
+
+def signup(app, email, user_type):
+    client = app.test_client()
+    client.post('/signup', data={'email': email, 'password': 'password123', 'name': email.split('@')[0],
+                                 'user_type': user_type})
+    client.post('/login', data={'email': email, 'password': 'password123'})
+    return client
+
+
+def post_swap(client, title):
+    client.post('/request/new', data={'title': title, 'difficulty': 'Easy', 'category': 'technology',
+                                      'is_swap': 'on'})
+
+
+def request_id(app, title):
+    return next(r['id'] for r in get_state(app).requests_db if r['title'] == title)
+
+
+def counters(app, email):
+    return get_state(app).achievements_db.get(email, {}).get('counters', {})
+
+
+def test_closing_an_unaccepted_request_earns_nothing(app):
+    senior = signup(app, 'solo@test.com', 'senior')
+    for n in range(5):
+        post_swap(senior, f'Phone help {n}')
+        senior.get(f'/request/{request_id(app, f"Phone help {n}")}/complete')
+
+    user = get_state(app).users_db['solo@test.com']
+    assert [b['id'] for b in user['badges']] == ['newcomer']    # given at signup
+    assert not counters(app, 'solo@test.com').get('swaps_taught')
+    assert not counters(app, 'solo@test.com').get('tech_learned')
+
+
+def test_only_participants_earn_credit(app):
+    senior = signup(app, 'teacher@test.com', 'senior')
+    youth = signup(app, 'learner@test.com', 'youth')
+    bystander = signup(app, 'bystander@test.com', 'youth')
+
+    post_swap(senior, 'Video calls')
+    rid = request_id(app, 'Video calls')
+    youth.get(f'/request/{rid}/accept')
+    bystander.get(f'/request/{rid}/complete')
+    assert 'swaps' not in counters(app, 'learner@test.com')
+
+    post_swap(senior, 'Online banking')
+    rid = request_id(app, 'Online banking')
+    youth.get(f'/request/{rid}/accept')
+    senior.get(f'/request/{rid}/complete')
+
+    assert counters(app, 'learner@test.com')['tasks_helped'] == 1
+    assert counters(app, 'teacher@test.com')['swaps_taught'] == 1
+    badge_ids = {b['id'] for b in get_state(app).users_db['teacher@test.com']['badges']}
+    assert {'first_swap', 'wisdom_sharer'} <= badge_ids
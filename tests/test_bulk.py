@@ -0,0 +1,131 @@
+"""
+Tests: bulk import validation, round trips and unreadable uploads
+"""
+
+import io
+
+import pytest
+
+from careswap import bulk, create_app
+from careswap.catalog import points_map
+from careswap.state import get_state
+
+
+@pytest.fixture(autouse=True)
+def no_env_config(monkeypatch):
+    for name in ('CARESWAP_SNAPSHOT_PATH', 'CARESWAP_ARCHIVE_PATH', 'CARESWAP_PRELOAD'):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def app():
+    app = create_app({'TESTING': True})
+    get_state(app).load()
+    return app
+
+
+def collect(batches):
+    return lambda batch: batches.append(list(batch))
+
+
+def test_user_rows_are_validated():
+    users_db = {'taken@test.com': {}}
+    rows = [
+        (2, {'email': 'new@test.com', 'name': 'New', 'type': 'youth', 'password': 'secret1'}),
+        (3, {'email': 'taken@test.com', 'name': 'Taken', 'password': 'secret1'}),
+        (4, {'email': 'new@test.com', 'name': 'Again', 'password': 'secret1'}),
+        (5, {'email': 'short@test.com', 'name': 'Short', 'password': 'abc'}),
+        (6, {'email': 'odd@test.com', 'name': 'Odd', 'type': 'robot', 'password': 'secret1'}),
+    ]
+    batches = []
+
+    summary = bulk.run_import(rows, lambda row, pending: bulk.validate_user_row(row, users_db, pending),
+                              collect(batches))
+
+    assert summary['imported'] == 1 and summary['skipped'] == 4
+    assert [e.split(':')[0] for e in summary['errors']] == ['Line 3', 'Line 4', 'Line 5', 'Line 6']
+    assert batches[0][0]['email'] == 'new@test.com'
+
+
+def test_request_rows_need_known_users():
+    users_db = {'senior@test.com': {}}
+    rows = [
+        (2, {'title': 'Ok', 'posted_by': 'senior@test.com'}),
+        (3, {'title': 'Nobody', 'posted_by': 'ghost@test.com'}),
+        (4, {'title': 'Taken', 'posted_by': 'senior@test.com', 'status': 'In Progress'}),
+        (5, {'title': 'Bad date', 'posted_by': 'senior@test.com', 'posted_date': '19/10/2026'}),
+    ]
+
+    summary = bulk.run_import(rows, lambda row, pending: bulk.validate_request_row(row, users_db, points_map),
+                              lambda batch: None)
+
+    assert summary['imported'] == 1 and summary['skipped'] == 3
+    assert 'Unknown poster' in summary['errors'][0]
+    assert 'need accepted_by' in summary['errors'][1]
+
+
+def test_batches_are_committed_in_chunks():
+    rows = [(i, {'timestamp': '2026-10-19T10:00:00', 'admin': 'a@x', 'action': 'warn'}) for i in range(5)]
+    batches = []
+    bulk.run_import(rows, lambda row, pending: bulk.validate_log_row(row), collect(batches), batch_size=2)
+    assert [len(b) for b in batches] == [2, 2, 1]
+
+
+@pytest.mark.parametrize('fmt', bulk.FORMATS)
+def test_export_round_trips(fmt):
+    records = [{
+        'timestamp': '2026-10-19T10:00:00', 'admin': 'admin@careswap.sg', 'action': 'warn',
+        'target': 'senior@test.com', 'details': '=HYPERLINK("http://evil")'
+    }]
+    text = ''.join(bulk.stream_export(records, fmt, bulk.EXPORT_FIELDS['logs']))
+    if fmt == 'csv':
+        assert "'=HYPERLINK" in text
+
+    rows = list(bulk.iter_rows(io.StringIO(text, newline=''), fmt))
+    assert bulk.validate_log_row(rows[0][1]) == records[0]
+
+
+def test_requests_export_imports_back(app):
+    with app.app_context():
+        from careswap.helpers import export_dataset, import_dataset
+        state = get_state(app)
+        before = len(state.requests_db)
+
+        text = ''.join(export_dataset('requests', 'csv'))
+        summary = import_dataset('requests', io.StringIO(text, newline=''), 'csv')
+
+    assert summary['imported'] == before and not summary['skipped']
+    assert [r['title'] for r in state.requests_db[before:]] == [r['title'] for r in state.requests_db[:before]]
+
+
+def test_undecodable_upload_keeps_earlier_rows(app):
+    client = app.test_client()
+    client.post('/admin/login', data={'email': 'admin@careswap.sg', 'password': 'admin123'})
+    state = get_state(app)
+    before = len(state.admin_logs)
+
+    # Text is decoded in chunks, so the good rows must span more than one
+    upload = b'timestamp,admin,action,target,details\n'
+    upload += b'2026-10-19T10:00:00,a@careswap.sg,warn,x,ok\n' * 1000
+    upload += b'2026-10-19T11:00:00,a@careswap.sg,warn,x,caf\xe9\n'
+    response = client.post('/admin/import/logs', data={'file': (io.BytesIO(upload), 'logs.csv')},
+                           follow_redirects=True)
+
+    assert response.status_code == 200
+    assert b'not UTF-8 text' in response.data
+    imported = [log for log in state.admin_logs[before:] if log['action'] == 'warn']
+    assert 0 < len(imported) < 1000
+    assert {log['details'] for log in imported} == {'ok'}
+    assert f'Imported {len(imported)} logs'.encode() in response.data
+    assert state.admin_logs[-1]['action'] == 'import'
+    assert 'stopped early' in state.admin_logs[-1]['details']
+
+
+def test_cli_reports_unreadable_files(app, tmp_path):
+    source = tmp_path / 'logs.csv'
+    source.write_bytes(b'timestamp,admin,action,target,details\n2026-10-19T10:00:00,a@x,warn,x,caf\xe9\n')
+
+    result = app.test_cli_runner().invoke(args=['import-data', 'logs', str(source)])
+
+    assert result.exit_code == 1
+    assert 'not UTF-8 text' in result.output
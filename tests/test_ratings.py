@@ -0,0 +1,106 @@
+"""
+Tests: rating aggregates, the recent window and who may rate
+"""
+
+import pytest
+
+from careswap import create_app, ratings
+from careswap.state import get_state
+
+
+def make_user(email, rating=0, rating_count=0):
+    return {'email': email, 'rating': rating, 'rating_count': rating_count}
+
+
+def make_request(request_id, poster='senior@test.com', helper='youth@test.com', status='Completed'):
+    return {'id': request_id, 'posted_by': poster, 'accepted_by': helper, 'status': status}
+
+
+@pytest.fixture
+def users_db():
+    return {
+        'senior@test.com': make_user('senior@test.com', rating=4.0, rating_count=2),
+        'youth@test.com': make_user('youth@test.com')
+    }
+
+
+@pytest.fixture
+def book(users_db):
+    return ratings.RatingBook(users_db, [], {})
+
+
+def test_aggregates_update_incrementally(book, users_db):
+    book.add(make_request(1), 'youth@test.com', 5)
+    book.add(make_request(2), 'youth@test.com', 2)
+
+    senior = users_db['senior@test.com']
+    assert senior['rating_count'] == 4
+    assert senior['rating'] == round((4.0 * 2 + 5 + 2) / 4, 2)
+    assert book.global_mean() == (4.0 * 2 + 5 + 2) / 4
+    # Shrunk towards the global mean until there are more ratings
+    assert book.adjusted_score('senior@test.com') == pytest.approx(
+        (ratings.PRIOR_WEIGHT * book.global_mean() + 15) / (ratings.PRIOR_WEIGHT + 4))
+    assert len(book.ratings_db) == 2
+
+
+def test_recent_window_keeps_the_latest_ratings(book):
+    assert book.recent_average('senior@test.com') is None
+
+    stars = [1] * 5 + [5] * ratings.RECENT_WINDOW
+    for request_id, value in enumerate(stars, start=1):
+        book.add(make_request(request_id), 'youth@test.com', value)
+
+    assert book.recent_average('senior@test.com') == 5
+    assert book.state_db['users']['senior@test.com']['count'] == 2 + len(stars)
+
+
+def test_each_participant_rates_once(book):
+    req = make_request(1)
+    assert book.can_rate(req, 'youth@test.com')
+    book.add(req, 'youth@test.com', 4)
+
+    assert not book.can_rate(req, 'youth@test.com')
+    with pytest.raises(ratings.RatingError, match='already rated'):
+        book.add(req, 'youth@test.com', 4)
+    # The other side still can
+    assert book.can_rate(req, 'senior@test.com')
+
+
+def test_self_ratings_are_rejected(book):
+    req = make_request(1, helper='senior@test.com')
+    assert not book.can_rate(req, 'senior@test.com')
+    with pytest.raises(ratings.RatingError, match='yourself'):
+        book.add(req, 'senior@test.com', 5)
+
+
+@pytest.mark.parametrize('req, rater, stars', [
+    (make_request(1, status='In Progress'), 'youth@test.com', 5),
+    (make_request(1, helper=None), 'senior@test.com', 5),
+    (make_request(1), 'stranger@test.com', 5),
+    (make_request(1), 'youth@test.com', 6)
+])
+def test_invalid_ratings_are_rejected(book, req, rater, stars):
+    assert not (stars <= ratings.MAX_STARS and book.can_rate(req, rater))
+    with pytest.raises(ratings.RatingError):
+        book.add(req, rater, stars)
+    assert book.ratings_db == []
+
+
+def test_youth_dashboard_links_back_to_rating(monkeypatch):
+    for name in ('CARESWAP_SNAPSHOT_PATH', 'CARESWAP_ARCHIVE_PATH', 'CARESWAP_PRELOAD'):
+        monkeypatch.delenv(name, raising=False)
+    app = create_app({'TESTING': True})
+    senior, youth = app.test_client(), app.test_client()
+    senior.post('/login', data={'email': 'senior@test.com', 'password': 'password123'})
+    youth.post('/login', data={'email': 'youth@test.com', 'password': 'password123'})
+
+    senior.post('/request/new', data={'title': 'Water the plants', 'difficulty': 'Easy'})
+    rid = next(r['id'] for r in get_state(app).requests_db if r['title'] == 'Water the plants')
+    youth.get(f'/request/{rid}/accept')
+    youth.get(f'/request/{rid}/complete')    # leaves the rating page unvisited
+
+    rate_link = f'/request/{rid}/rate'.encode()
+    assert rate_link in youth.get('/dashboard/youth').data
+
+    youth.post(rate_link.decode(), data={'stars': 5})
+    assert rate_link not in youth.get('/dashboard/youth').data